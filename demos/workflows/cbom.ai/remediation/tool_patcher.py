@@ -39,6 +39,11 @@ def patcher_tool(
         repo = match.group(2)
         repobase = org + "/" + repo
 
+    # reject obviously bad patches before paying for a clone
+    patch_len = len(patch)
+    if patch_len < 200:
+        return "ERROR. Specify a valid patch. " + str(patch_len) + " is too short"
+
     branch = "remediation_" + str(random.randint(0, 9999))
 
     if os.environ.get("BEE_DEBUG") is not None:
@@ -51,7 +56,7 @@ def patcher_tool(
         )
 
     os.system(
-        "rm -fr workspace && mkdir -p workspace && cd workspace && git clone "
+        "rm -fr workspace && mkdir -p workspace && cd workspace && git clone --depth=1 "
         + "https://"
         + github_apikey
         + "@github.com/"
@@ -72,15 +77,17 @@ def patcher_tool(
         + " >../out 2>&1"
     )
 
-    # patch
-    patch_len = len(patch)
-    if patch_len < 200:
-        return "ERROR. Specify a valid patch. " + str(patch_len) + " is too short"
-
     with open("workspace/patchfile", "w") as f:
         f.write(patch)
         f.close()
 
+    # make sure the patch applies before committing, pushing and opening a PR
+    if os.system("cd workspace/repo && git apply --check '../patchfile' >../out 2>&1") != 0:
+        with open("workspace/out", "r") as f:
+            patch_output = f.read()
+        os.system("cd workspace && rm -fr repo >out 2>&1")
+        return "ERROR. Patch does not apply cleanly: " + patch_output
+
     if os.environ.get("BEE_DEBUG") is not None:
         print("DEBUG: [patcher-tool] " + "Applying patch")
     os.system("cd workspace/repo && git am < '../patchfile' >../out 2>&1")
@@ -12,21 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from .workflow import Workflow
-
-from .agents.beeai_agent import BeeAIAgent
-from .agents.crewai_agent import CrewAIAgent
-from .agents.openai_agent import OpenAIAgent
-from .agents.remote_agent import RemoteAgent
-
-from .agents.agent import save_agent, restore_agent, remove_agent
-from .deploy import Deploy
+# Public names are resolved on first access (PEP 562) so that importing a
+# single submodule, or the CLI, does not pull in every agent framework.
+_LAZY = {
+    "Workflow": (".workflow", "Workflow"),
+    "BeeAIAgent": (".agents.beeai_agent", "BeeAIAgent"),
+    "CrewAIAgent": (".agents.crewai_agent", "CrewAIAgent"),
+    "OpenAIAgent": (".agents.openai_agent", "OpenAIAgent"),
+    "RemoteAgent": (".agents.remote_agent", "RemoteAgent"),
+    "save_agent": (".agents.agent", "save_agent"),
+    "restore_agent": (".agents.agent", "restore_agent"),
+    "remove_agent": (".agents.agent", "remove_agent"),
+    "Deploy": (".deploy", "Deploy"),
+}
 
-__all__ = {
+__all__ = [
     "Workflow",
     "Deploy"
-}
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
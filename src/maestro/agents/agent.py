@@ -18,19 +18,20 @@ class Agent:
             agent_name (str): The name of the agent.
         """
         # TODO: Review which attributes belong in base class vs subclasses
+        spec = agent['spec']
         self.agent_name = agent['metadata']['name']
-        self.agent_framework = agent['spec']['framework']
-        self.agent_model = agent['spec'].get('model')
+        self.agent_framework = spec['framework']
+        self.agent_model = spec.get('model')
 
-        self.agent_tools = agent['spec'].get('tools', [])
+        self.agent_tools = spec.get('tools', [])
 
-        self.agent_desc = agent['spec'].get('description')
-        self.agent_instr = agent['spec'].get('instructions')
+        self.agent_desc = spec.get('description')
+        self.agent_instr = spec.get('instructions')
 
-        self.agent_input = agent['spec'].get('input')
-        self.agent_output = agent['spec'].get('output')
+        self.agent_input = spec.get('input')
+        self.agent_output = spec.get('output')
 
-        self.agent_code = agent['spec'].get('code')
+        self.agent_code = spec.get('code')
 
         self.instructions = f'{self.agent_instr} Input is expected in format: {self.agent_input}' if self.agent_input else self.agent_instr
         self.instructions = f'{self.instructions} Output must be in format: {self.agent_output}' if self.agent_output else self.instructions
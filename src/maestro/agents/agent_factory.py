@@ -1,17 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
+import functools
+import importlib
 from enum import StrEnum
-from typing import Callable, Type, Union
+from typing import TYPE_CHECKING, Callable, Dict, Tuple, Union
 
-from .beeai_agent import BeeAIAgent, BeeAILocalAgent
-from .crewai_agent import CrewAIAgent
-from .openai_agent import OpenAIAgent
-from .remote_agent import RemoteAgent
-from .mock_agent import MockAgent
-from .custom_agent import CustomAgent
-from .code_agent import CodeAgent
-from .slack_agent import SlackAgent
-from .scoring_agent import ScoringAgent
-from .prompt_agent import PromptAgent
+if TYPE_CHECKING:
+    from .beeai_agent import BeeAIAgent, BeeAILocalAgent
+    from .crewai_agent import CrewAIAgent
+    from .openai_agent import OpenAIAgent
+    from .remote_agent import RemoteAgent
+    from .mock_agent import MockAgent
+    from .code_agent import CodeAgent
 
 class AgentFramework(StrEnum):
     """Enumeration of supported frameworks"""
@@ -26,10 +25,30 @@ class AgentFramework(StrEnum):
     # Not yet supported
     # LANGFLOW = 'langflow'
 
+# Agent classes as (module, class name); each framework SDK is only imported
+# when an agent of that framework is created
+_LOCAL_AGENTS: Dict[str, Tuple[str, str]] = {
+    AgentFramework.BEEAI: (".beeai_agent", "BeeAILocalAgent"),
+    AgentFramework.CREWAI: (".crewai_agent", "CrewAIAgent"),
+    AgentFramework.OPENAI: (".openai_agent", "OpenAIAgent"),
+    AgentFramework.CODE: (".code_agent", "CodeAgent"),
+    AgentFramework.MOCK: (".mock_agent", "MockAgent"),
+}
+
+_REMOTE_AGENTS: Dict[str, Tuple[str, str]] = {
+    AgentFramework.BEEAI: (".beeai_agent", "BeeAIAgent"),
+    AgentFramework.REMOTE: (".remote_agent", "RemoteAgent"),
+    AgentFramework.MOCK: (".mock_agent", "MockAgent"),
+}
+
+@functools.cache
+def _load_agent_class(module_name: str, class_name: str) -> type:
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
 class AgentFactory:
     """Factory class for handling agent frameworks"""
     @staticmethod
-    def create_agent(framework: AgentFramework, mode="local") -> Callable[..., Union[BeeAIAgent, BeeAILocalAgent, CrewAIAgent, OpenAIAgent, RemoteAgent, CodeAgent, MockAgent]]:
+    def create_agent(framework: AgentFramework, mode="local") -> Callable[..., Union["BeeAIAgent", "BeeAILocalAgent", "CrewAIAgent", "OpenAIAgent", "RemoteAgent", "CodeAgent", "MockAgent"]]:
         """Create an instance of the specified agent framework.
 
         Args:
@@ -38,31 +57,18 @@ class AgentFactory:
         Returns:
             A new instance of the corresponding agent class.
         """
-        factories = {
-            AgentFramework.BEEAI: BeeAILocalAgent,
-            AgentFramework.CREWAI: CrewAIAgent,
-            AgentFramework.OPENAI: OpenAIAgent,
-            AgentFramework.CODE: CodeAgent,
-            AgentFramework.MOCK: MockAgent
-        }
-
-        remote_factories = {
-            AgentFramework.BEEAI: BeeAIAgent,
-            AgentFramework.REMOTE: RemoteAgent,
-            AgentFramework.MOCK: MockAgent
-        }
         if framework == "custom":
-            return CustomAgent
+            return _load_agent_class(".custom_agent", "CustomAgent")
 
-        if framework not in factories and framework not in remote_factories:
+        if framework not in _LOCAL_AGENTS and framework not in _REMOTE_AGENTS:
             raise ValueError(f"Unknown framework: {framework}")
 
         if mode == "remote" or framework == AgentFramework.REMOTE:
-            return remote_factories[framework]
+            return _load_agent_class(*_REMOTE_AGENTS[framework])
         else:
-            return factories[framework]
+            return _load_agent_class(*_LOCAL_AGENTS[framework])
 
     @classmethod
-    def get_factory(cls, framework: str, mode="local") -> Callable[..., Union[BeeAIAgent, BeeAILocalAgent, CrewAIAgent, OpenAIAgent, RemoteAgent, CodeAgent, MockAgent]]:
+    def get_factory(cls, framework: str, mode="local") -> Callable[..., Union["BeeAIAgent", "BeeAILocalAgent", "CrewAIAgent", "OpenAIAgent", "RemoteAgent", "CodeAgent", "MockAgent"]]:
         """Get a factory function for the specified agent type."""
         return cls.create_agent(framework, mode)
@@ -1,8 +1,9 @@
 #! /usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
-import os, dotenv
+import os
 import asyncio
+import functools
 import requests
 import json
 
@@ -27,7 +28,20 @@ from beeai_framework.utils import AbortSignal
 
 from maestro.agents.agent import Agent
 
-dotenv.load_dotenv()
+def _bee_api() -> str:
+    """Returns the BeeAI API location, read on use so settings made after import apply."""
+    bee_api = os.getenv("BEE_API")
+    if not bee_api:
+        raise RuntimeError("BEE_API environment variable is not set")
+    return bee_api
+
+@functools.lru_cache(maxsize=4)
+def _bee_openai_client(base_url: str, api_key: str | None) -> OpenAI:
+    return OpenAI(base_url=f'{base_url}/v1', api_key=api_key)
+
+def _bee_client() -> OpenAI:
+    """Returns the OpenAI client for the BeeAI API, shared by all agents using it."""
+    return _bee_openai_client(_bee_api(), os.getenv("BEE_API_KEY"))
 
 class BeeAIAgent(Agent):
     """
@@ -43,7 +57,7 @@ class BeeAIAgent(Agent):
         """
         super().__init__(agent)
     
-        url = f'{os.getenv("BEE_API")}/v1/assistants'
+        url = f'{_bee_api()}/v1/assistants'
         headers = {
             'accept': "application/json",
             'Authorization': "Bearer sk-proj-testkey",
@@ -81,9 +95,7 @@ class BeeAIAgent(Agent):
             prompt (str): The prompt to run the agent with.
         """
         self.print(f"Running {self.agent_name}...\n")
-        client = OpenAI(
-            base_url=f'{os.getenv("BEE_API")}/v1', api_key=os.getenv("BEE_API_KEY")
-        )
+        client = _bee_client()
         # TODO: Unused currently
         assistant = client.beta.assistants.retrieve(self.agent_id)
         thread = client.beta.threads.create(
@@ -104,9 +116,7 @@ class BeeAIAgent(Agent):
             prompt (str): The prompt to run the agent with.
         """    
         self.print(f"Running {self.agent_name}...\n")
-        client = OpenAI(
-            base_url=f'{os.getenv("BEE_API")}/v1', api_key=os.getenv("BEE_API_KEY")
-        )
+        client = _bee_client()
         assistant = client.beta.assistants.retrieve(self.agent_id)
         thread = client.beta.threads.create(
             messages=[{"role": "user", "content": str(prompt)}]
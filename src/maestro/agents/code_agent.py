@@ -2,14 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import functools
 import os
-from dotenv import load_dotenv
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
 
 from maestro.agents.agent import Agent
 
-load_dotenv()
+@functools.lru_cache(maxsize=64)
+def _compile_code(source: str):
+    """Compiles agent code once per distinct source; code objects can't be pickled with the agent."""
+    return compile(source, "<string>", "exec")
 
 class CodeAgent(Agent):
     """
@@ -33,13 +34,13 @@ class CodeAgent(Agent):
         self.print(f"Running {self.agent_name} with {args}...\n")
         local = {"input": args, "output": {}}
         try:
-            exec(self.agent_code, local)
+            exec(_compile_code(self.agent_code), local)
         except Exception as e:
             self.print(f"Exception executing code: {e}\n")
             raise e
         answer = str(local["output"])
         self.print(f"Response from {self.agent_name}: {answer}\n")        
-        return str(local["output"])
+        return answer
 
     async def run_streaming(self, *args, context=None) -> str:
         """
@@ -47,17 +48,4 @@ class CodeAgent(Agent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-
-        self.print(f"Running {self.agent_name} with {args}...\n")
-        local = {"input": args, "output": {}}
-        try:
-            exec(self.agent_code, local)
-        except Exception as e:
-            self.print(f"Exception executing code: {e}\n")
-            raise e
-        answer = str(local["output"])
-        self.print(f"Response from {self.agent_name}: {answer}\n")        
-        return str(local["output"])
-
-
-
+        return await self.run(*args, context=context)
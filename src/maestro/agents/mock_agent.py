@@ -5,15 +5,12 @@ import os
 import time
 import asyncio
 
-from dotenv import load_dotenv
 from openai import AssistantEventHandler, OpenAI
 from openai.types.beta import AssistantStreamEvent
 from openai.types.beta.threads.runs import RunStep, RunStepDelta, ToolCall
 
 from .agent import Agent
 
-load_dotenv()
-
 def eval_expression(expression, prompt):
     local = {}
     local["input"] = prompt
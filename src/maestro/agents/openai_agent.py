@@ -1,18 +1,30 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import io
 import os
+import ssl
+import sys
+import time
+import asyncio
+import functools
 import json
-import traceback
-from typing import Final, List, Optional, Any, Dict
+import hashlib
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Final, FrozenSet, List, Optional, Any, Callable, Dict, Tuple
 
 import logfire
 
+import httpx
+from openai import DefaultAsyncHttpxClient
 # raw responses for streaming
 from openai.types.responses import ResponseTextDeltaEvent
 
 from agents import (
     Agent as UnderlyingAgent,
     Runner as UnderlyingRunner,
+    RunResult,
     AsyncOpenAI as UnderlyingClient,
     set_tracing_disabled,
     set_default_openai_client,
@@ -24,13 +36,113 @@ from agents import (
 from agents.extensions.models.litellm_model import LitellmModel
 
 from maestro.agents.agent import Agent as MaestroAgent
-from maestro.agents.openai_mcp import setup_mcp_servers, MCPServerInstance
+from maestro.agents.openai_mcp import MCPServerManager, MCPServerInstance
 
 
-SUPPORTED_TOOL_NAME: Final[str] = "web_search"
-TOOL_REQUIRES_RESPONSES_API: Final[bool] = True
+SUPPORTED_TOOLS: Final[FrozenSet[str]] = frozenset({"web_search"})
+TOOLS_REQUIRING_RESPONSES_API: Final[FrozenSet[str]] = frozenset({"web_search"})
 OPENAI_DEFAULT_URL: Final[str] = "https://api.openai.com/v1"
 OPENAI_DEFAULT_MODEL: Final[str] = "gpt-4o-mini"
+# Streamed text is flushed to stdout after this many deltas, or this many
+# seconds after the first unflushed delta
+STREAM_FLUSH_DELTAS: Final[int] = 16
+STREAM_FLUSH_INTERVAL: Final[float] = 0.05
+
+logger = logging.getLogger(__name__)
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Returns the SSL context shared by all clients; loading CA certificates is costly."""
+    return httpx.create_ssl_context()
+
+@functools.cache
+def _web_search_tool() -> Tool:
+    """Returns the WebSearchTool shared by all agents; it holds configuration only."""
+    return WebSearchTool()
+
+# Builds each supported static tool by name
+TOOL_FACTORIES: Final[Dict[str, Callable[[], Tool]]] = {
+    "web_search": _web_search_tool,
+}
+
+# AsyncOpenAI clients, and so their HTTP connection pools, shared by all agents
+# using the same endpoint and key. Pools are bound to an event loop, so each
+# loop (e.g. each asyncio.run) gets its own clients, which are dropped with it.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str]], UnderlyingClient]]" = weakref.WeakKeyDictionary()
+
+def _shared_client(base_url: str, api_key: Optional[str]) -> UnderlyingClient:
+    """Returns the running loop's client for an endpoint, creating and instrumenting it on first use."""
+    loop = asyncio.get_running_loop()
+    # clients of closed loops are unusable, and their pools may still
+    # reference the loop, so drop them rather than wait for collection
+    for closed in [other for other in _CLIENTS if other.is_closed()]:
+        del _CLIENTS[closed]
+    clients = _CLIENTS.get(loop)
+    if clients is None:
+        clients = _CLIENTS[loop] = {}
+    client = clients.get((base_url, api_key))
+    if client is None:
+        client = clients[(base_url, api_key)] = UnderlyingClient(
+            base_url=base_url,
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(verify=_ssl_context()),
+        )
+        # Logfire instruments OpenAPI calls with OpenTelemetry, once per client
+        logfire.instrument_openai(client)
+    return client
+
+# Opt-in cache of responses to repeated prompts, keyed on a digest of agent,
+# model, instructions and prompt; see MAESTRO_OPENAI_RESPONSE_CACHE_TTL
+RESPONSE_CACHE_MAXSIZE: Final[int] = 1024
+_RESPONSE_CACHE: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+# Runs in progress for a response cache key; concurrent identical prompts wait
+# for the first run's response instead of each calling the model
+_IN_FLIGHT: Dict[bytes, "asyncio.Future[Optional[str]]"] = {}
+
+# Logfire configuration and SDK instrumentation are process wide, so traces
+# carry one service name and agents are told apart by a span attribute
+LOGFIRE_SERVICE_NAME: Final[str] = "maestro"
+_logfire_configured: bool = False
+
+def _parse_trace_sample_rate(rate_str: str) -> Optional[float]:
+    """Parses a MAESTRO_OPENAI_TRACE_SAMPLE_RATE value, None if not between 0 and 1."""
+    try:
+        rate = float(rate_str)
+    except ValueError:
+        return None
+    return rate if 0.0 <= rate <= 1.0 else None
+
+def _configure_logfire() -> None:
+    """Configures logfire and instruments the Agents SDK once per process."""
+    global _logfire_configured
+    if _logfire_configured:
+        return
+    rate_str = os.getenv("MAESTRO_OPENAI_TRACE_SAMPLE_RATE")
+    sample_rate = _parse_trace_sample_rate(rate_str) if rate_str else None
+    # Logfire instruments OpenAPI calls with OpenTelemetry (logfire SAAS disabled)
+    # Set OTEL_EXPORTER_OTLP_TRACES_ENDPOINT
+    logfire.configure(
+        service_name=LOGFIRE_SERVICE_NAME,
+        send_to_logfire=False,
+        # spans go to the OTLP exporter only, not between the agents' stdout
+        console=False,
+        distributed_tracing=True,
+        # head sampling decides per trace id, so sampled traces stay whole
+        sampling=logfire.SamplingOptions(head=1.0 if sample_rate is None else sample_rate)
+    )
+    logfire.instrument_openai_agents()
+    _logfire_configured = True
+
+# API mode last applied to the Agents SDK, which keeps it process wide
+_api_mode: Optional[str] = None
+
+def _ensure_api_mode(mode: str) -> None:
+    """Sets the Agents SDK default API mode unless it is already applied."""
+    global _api_mode
+    if _api_mode != mode:
+        set_default_openai_api(mode)
+        _api_mode = mode
 
 class OpenAIAgent(MaestroAgent):
     """
@@ -38,9 +150,12 @@ class OpenAIAgent(MaestroAgent):
     Supports observability, MCP, streaming.
     """
 
+    # Client most recently installed as the Agents SDK default
+    _default_client: Optional[UnderlyingClient] = None
+
     def __init__(self, agent_definition: dict) -> None:
         """
-        Initializes the OpenAI agent, configures tracing, client, and tools.
+        Initializes the OpenAI agent from its definition; tracing and the client are set up on first run.
 
         Args:
             agent_definition (dict): The agent definition dictionary from YAML.
@@ -55,39 +170,56 @@ class OpenAIAgent(MaestroAgent):
         self.uses_chat_completions: bool = self.base_url != OPENAI_DEFAULT_URL
         self.use_litellm: bool = os.getenv("MAESTRO_OPENAI_USE_LITELLM", "false").lower() == "true"
         self.endpoint_has_tracing: bool = self.base_url == OPENAI_DEFAULT_URL
-        self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Using Base URL: {self.base_url}")
+        logger.debug("[OpenAIAgent %s]: Using Base URL: %s", self.agent_name, self.base_url)
         self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using Model: {self.model_name}")
-        self.client: UnderlyingClient = UnderlyingClient(
-                                            base_url=self.base_url,
-                                            api_key=self.api_key,
-                                        )
         self.static_tools: List[Tool] = self._initialize_static_tools(spec_dict)
         self.max_tokens: Optional[int] = self._initialize_max_tokens()
         self.extra_headers: Optional[Dict[str, str]] = self._initialize_extra_headers()
-        self._configure_agents_library()
-
-    def _configure_agents_library(self) -> None:
-        set_default_openai_client(client=self.client, use_for_tracing=True)
-
-        # Only use OpenAPI tracing for official endpoint
-        set_tracing_disabled(not self.endpoint_has_tracing)
-
-        # Logfire instruments OpenAPI calls with OpenTelemetry (logfire SAAS disabled)
-        # Set OTEL_EXPORTER_OTLP_TRACES_ENDPOINT
-        logfire.configure(
-            service_name=self.agent_name,
-            send_to_logfire=False,
-            distributed_tracing=True
-        )
-        logfire.instrument_openai(self.client)
-        logfire.instrument_openai_agents()
-        
+        self.parallel_tool_calls: Optional[bool] = self._initialize_parallel_tool_calls()
+        self.response_cache_ttl: Optional[float] = self._initialize_response_cache_ttl()
+        self._report_trace_sample_rate()
+        # read once; run() and run_streaming() consult it on every call
+        self.streaming_override: str = os.getenv("MAESTRO_OPENAI_STREAMING", "auto").lower()
+        self.mcp_servers = MCPServerManager(print_func=self.print, agent_name=self.agent_name)
+        self._report_api_selection()
+        # model and settings are fixed for the agent, only MCP servers vary per run
+        self.model: Any = self._initialize_model()
+        self.model_settings: ModelSettings = self._initialize_model_settings()
+        self._underlying_agent: Optional[UnderlyingAgent] = None
+
+    @property
+    def client(self) -> UnderlyingClient:
+        """The client for this agent's endpoint on the running event loop, created on first use."""
+        return self._activate_client()
+
+    def _activate_client(self) -> UnderlyingClient:
+        """
+        Returns the shared client for this agent's endpoint and installs it as
+        the Agents SDK default. Called from a run, so a client created here is
+        bound to the running event loop. Process wide library configuration is
+        also deferred to here, so agents that never run never pay for it.
+        """
+        _configure_logfire()
+        # responses API is new api - assume compatible endpoints don't yet support
+        if self.uses_chat_completions and not self.use_litellm:
+            _ensure_api_mode("chat_completions")
+        client = _shared_client(self.base_url, self.api_key)
+        # SDK defaults are process wide; agents sharing a client share the same
+        # endpoint, so they only need setting when the client changes
+        if OpenAIAgent._default_client is not client:
+            set_default_openai_client(client=client, use_for_tracing=True)
+
+            # Only use OpenAPI tracing for official endpoint
+            set_tracing_disabled(not self.endpoint_has_tracing)
+            OpenAIAgent._default_client = client
+        return client
+
+    def _report_api_selection(self) -> None:
+        """Reports the API the agent will use; it is applied on first run."""
         if self.use_litellm:
             self.print(f"INFO [OpenAIAgent {self.agent_name}]: LiteLLM enabled. API selection handled by LiteLLM.")
         else:
-            # responses API is new api - assume compatible endpoints don't yet support
             if self.uses_chat_completions:
-                set_default_openai_api("chat_completions")
                 self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using 'chat_completions' API (via OpenAI client).")
             else:
                 self.print(f"INFO [OpenAIAgent {self.agent_name}]: Assuming 'Responses' API (via OpenAI client).")
@@ -96,28 +228,28 @@ class OpenAIAgent(MaestroAgent):
     def _initialize_static_tools(self, agent_spec: dict) -> List[Tool]:
         agent_tool_names: Optional[List[str]] = agent_spec.get("tools")
         openai_tools: List[Tool] = []
-        tool_requested = agent_tool_names and SUPPORTED_TOOL_NAME in agent_tool_names
 
-        if not tool_requested:
-            if agent_tool_names:
-                self.print(f"WARN [OpenAIAgent {self.agent_name}]: Tools {agent_tool_names} ignore unsupported tool: '{SUPPORTED_TOOL_NAME}'.")
-            else:
-                self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: No static tools requested.")
+        if not agent_tool_names:
+            logger.debug("[OpenAIAgent %s]: No static tools requested.", self.agent_name)
             return openai_tools
 
-        self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Tool '{SUPPORTED_TOOL_NAME}' requested.")
-
-        if TOOL_REQUIRES_RESPONSES_API and self.uses_chat_completions:
-            self.print(f"WARN [OpenAIAgent {self.agent_name}]: Skipping tool '{SUPPORTED_TOOL_NAME}' due to API incompatibility.")
+        requested = SUPPORTED_TOOLS.intersection(agent_tool_names)
+        if not requested:
+            self.print(f"WARN [OpenAIAgent {self.agent_name}]: Tools {agent_tool_names} ignore unsupported tools, supported: {sorted(SUPPORTED_TOOLS)}.")
             return openai_tools
 
-        try:
-            tool_instance = WebSearchTool()
-            openai_tools.append(tool_instance)
-            self.print(f"INFO [OpenAIAgent {self.agent_name}]: Added static tool: {SUPPORTED_TOOL_NAME}")
-        except Exception as e:
-            self.print(f"ERROR [OpenAIAgent {self.agent_name}]: Failed to instantiate tool '{SUPPORTED_TOOL_NAME}': {e}")
-            return []
+        for tool_name in sorted(requested):
+            logger.debug("[OpenAIAgent %s]: Tool '%s' requested.", self.agent_name, tool_name)
+
+            if tool_name in TOOLS_REQUIRING_RESPONSES_API and self.uses_chat_completions:
+                self.print(f"WARN [OpenAIAgent {self.agent_name}]: Skipping tool '{tool_name}' due to API incompatibility.")
+                continue
+
+            try:
+                openai_tools.append(TOOL_FACTORIES[tool_name]())
+                self.print(f"INFO [OpenAIAgent {self.agent_name}]: Added static tool: {tool_name}")
+            except Exception as e:
+                self.print(f"ERROR [OpenAIAgent {self.agent_name}]: Failed to instantiate tool '{tool_name}': {e}")
 
         return openai_tools
 
@@ -133,7 +265,7 @@ class OpenAIAgent(MaestroAgent):
                     # Even if set, trace shows openai ignoring, also set OLLAMA_CONTEXT_LENGTH
                     # https://github.com/ollama/ollama/blob/main/docs/faq.md#how-can-i-specify-the-context-window-size
                     os.environ["OLLAMA_CONTEXT_LENGTH"] = str(max_tokens_int)
-                    self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Set OLLAMA_CONTEXT_LENGTH to {max_tokens_int}")
+                    logger.debug("[OpenAIAgent %s]: Set OLLAMA_CONTEXT_LENGTH to %s", self.agent_name, max_tokens_int)
                     return max_tokens_int
                 else:
                     self.print(f"WARN [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_MAX_TOKENS must be a positive integer, but got '{max_tokens_str}'. Ignoring.")
@@ -165,22 +297,164 @@ class OpenAIAgent(MaestroAgent):
                  self.print(f"WARN [OpenAIAgent {self.agent_name}]: Error processing MAESTRO_OPENAI_EXTRA_HEADERS='{headers_str}': {e}. Ignoring.")
         return None
 
+    def _initialize_parallel_tool_calls(self) -> Optional[bool]:
+        """Reads MAESTRO_OPENAI_PARALLEL_TOOL_CALLS environment variable.
+        When true the model may request several tool calls in one turn, which
+        the Agents SDK then executes concurrently instead of one per turn.
+        Left unset, the endpoint default applies.
+        """
+        parallel_str = os.getenv("MAESTRO_OPENAI_PARALLEL_TOOL_CALLS")
+        if not parallel_str:
+            return None
+        parallel = parallel_str.lower()
+        if parallel in ("true", "false"):
+            self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using parallel_tool_calls: {parallel}")
+            return parallel == "true"
+        self.print(f"WARN [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_PARALLEL_TOOL_CALLS must be 'true' or 'false', but got '{parallel_str}'. Ignoring.")
+        return None
+
+    def _report_trace_sample_rate(self) -> None:
+        """Reports MAESTRO_OPENAI_TRACE_SAMPLE_RATE environment variable.
+        The fraction of traces recorded, between 0 and 1. Defaults to 1 (all).
+        It applies to the whole process and is read when tracing is configured.
+        """
+        rate_str = os.getenv("MAESTRO_OPENAI_TRACE_SAMPLE_RATE")
+        if not rate_str:
+            return
+        rate = _parse_trace_sample_rate(rate_str)
+        if rate is None:
+            self.print(f"WARN [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_TRACE_SAMPLE_RATE must be a number between 0 and 1, but got '{rate_str}'. Ignoring.")
+            return
+        self.print(f"INFO [OpenAIAgent {self.agent_name}]: Sampling {rate:.0%} of traces")
+
+    def _initialize_model(self) -> Any:
+        # LiteLLM needs more than the model name in Agents SDK
+        if self.use_litellm:
+            self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using LiteLLM backend for model: {self.model_name}")
+            litellm_base_url = self.base_url if self.base_url != OPENAI_DEFAULT_URL else None
+            return LitellmModel(
+                model=self.model_name,
+                api_key=self.api_key,
+                base_url=litellm_base_url
+            )
+        return self.model_name # Use the string name for standard OpenAI client
+
+    def _initialize_model_settings(self) -> ModelSettings:
+        # TODO: Extend or make generic for more settings
+        model_settings_dict: Dict[str, Any] = {}
+        if self.max_tokens is not None:
+            model_settings_dict["max_tokens"] = self.max_tokens
+        if self.extra_headers is not None:
+            model_settings_dict["extra_headers"] = self.extra_headers
+        if self.parallel_tool_calls is not None:
+            model_settings_dict["parallel_tool_calls"] = self.parallel_tool_calls
+        return ModelSettings(**model_settings_dict)
+
+    def _build_underlying_agent(self, mcp_servers: List[MCPServerInstance]) -> UnderlyingAgent:
+        """
+        Returns the Agents SDK agent used for a run with the given MCP servers.
+        Everything else is fixed for the agent, so the SDK agent is reused
+        until the MCP servers are reconnected.
+        """
+        # the SDK resolves model names and exports traces through its default client
+        self._activate_client()
+        underlying_agent = self._underlying_agent
+        if underlying_agent is None or underlying_agent.mcp_servers != mcp_servers:
+            underlying_agent = self._underlying_agent = UnderlyingAgent(
+                name=self.agent_name,
+                instructions=self.instructions,
+                model=self.model,
+                tools=self.static_tools,
+                mcp_servers=mcp_servers,
+                model_settings=self.model_settings,
+            )
+        return underlying_agent
+
+    def __getstate__(self) -> dict:
+        # the SDK agent references live MCP connections
+        state = self.__dict__.copy()
+        state["_underlying_agent"] = None
+        return state
+
+    def _initialize_response_cache_ttl(self) -> Optional[float]:
+        """Reads MAESTRO_OPENAI_RESPONSE_CACHE_TTL environment variable.
+        When set to a positive number of seconds, responses to a prompt this
+        agent has already answered are reused for that long instead of calling
+        the model again. Agents with tools are never cached, as tool results
+        (web search, MCP) may change between calls.
+        """
+        ttl_str = os.getenv("MAESTRO_OPENAI_RESPONSE_CACHE_TTL")
+        if not ttl_str:
+            return None
+        try:
+            ttl = float(ttl_str)
+        except ValueError:
+            self.print(f"WARN [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_RESPONSE_CACHE_TTL is not a valid number: '{ttl_str}'. Ignoring.")
+            return None
+        if ttl <= 0:
+            return None
+        if self.static_tools or os.getenv("MAESTRO_MCP_ENDPOINTS", "").strip():
+            self.print(f"INFO [OpenAIAgent {self.agent_name}]: Response cache disabled, agent uses tools.")
+            return None
+        self.print(f"INFO [OpenAIAgent {self.agent_name}]: Caching responses for {ttl}s")
+        return ttl
+
+    def _response_cache_key(self, prompt: str) -> bytes:
+        key = "\0".join((self.agent_name, self.model_name, str(self.instructions), prompt))
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    def _cached_response(self, prompt: str) -> Optional[str]:
+        """Returns the cached response to prompt, if caching is on and it has not expired."""
+        if self.response_cache_ttl is None:
+            return None
+        key = self._response_cache_key(prompt)
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires < time.monotonic():
+            del _RESPONSE_CACHE[key]
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+        return response
+
+    def _cache_response(self, prompt: str, response: str) -> None:
+        if self.response_cache_ttl is None:
+            return
+        _RESPONSE_CACHE[self._response_cache_key(prompt)] = (time.monotonic() + self.response_cache_ttl, response)
+        if len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
     def _process_agent_result(self, result: Optional[Any]) -> str:
         if result is None:
             self.print(f"ERROR [OpenAIAgent {self.agent_name}]: Agent run did not produce a result object.")
             return "Error: Agent run failed to produce a result."
 
-        final_output = getattr(result, 'final_output', None)
+        final_output = self._final_output(result)
         if final_output is not None:
-            final_output_str = str(final_output)
-            return final_output_str
+            return final_output
+        return self._fallback_output(result)
+
+    @staticmethod
+    def _final_output(result: Optional[Any]) -> Optional[str]:
+        """Returns the final output of a run as text, or None if the run produced none."""
+        if isinstance(result, RunResult):
+            final_output = result.final_output
         else:
-            self.print(f"WARN [OpenAIAgent {self.agent_name}]: Agent run completed but no 'final_output' found.")
-            messages = getattr(result, 'messages', [])
-            last_message_content = messages[-1].content if messages and hasattr(messages[-1], 'content') else "No message content available."
-            fallback_str = f"Agent run finished without explicit final output. Last message: {last_message_content}"
-            self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: {fallback_str}")
-            return fallback_str
+            final_output = getattr(result, 'final_output', None)
+        if final_output is None or isinstance(final_output, str):
+            return final_output
+        return str(final_output)
+
+    def _fallback_output(self, result: Any) -> str:
+        """Builds the response from the last message of a run without final output."""
+        self.print(f"WARN [OpenAIAgent {self.agent_name}]: Agent run completed but no 'final_output' found.")
+        messages = getattr(result, 'messages', None)
+        last_message = messages[-1] if messages else None
+        last_message_content = getattr(last_message, 'content', "No message content available.")
+        fallback_str = f"Agent run finished without explicit final output. Last message: {last_message_content}"
+        logger.debug("[OpenAIAgent %s]: %s", self.agent_name, fallback_str)
+        return fallback_str
 
 
     # TODO: Cleanup streaming vs non-streaming
@@ -189,171 +463,179 @@ class OpenAIAgent(MaestroAgent):
     # Can be removed once supported in framework
     async def _run_internal(self, prompt: str) -> str:
         """Internal implementation for non-streaming run."""
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            self.print(f"Response from {self.agent_name} (cached): {cached}")
+            return cached
+        if self.response_cache_ttl is None:
+            return await self._run_uncached(prompt)
+
+        key = self._response_cache_key(prompt)
+        pending = _IN_FLIGHT.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            response = await asyncio.shield(pending)
+            if response is not None:
+                self.print(f"Response from {self.agent_name} (cached): {response}")
+                return response
+            # the first run failed, try again independently
+            return await self._run_uncached(prompt)
+
+        pending = _IN_FLIGHT[key] = asyncio.get_running_loop().create_future()
+        response: Optional[str] = None
+        try:
+            final_str = await self._run_uncached(prompt)
+            response = self._cached_response(prompt)
+            return final_str
+        finally:
+            if _IN_FLIGHT.get(key) is pending:
+                del _IN_FLIGHT[key]
+            pending.set_result(response)
+
+    async def _run_uncached(self, prompt: str) -> str:
         result: Optional[Any] = None
 
         try:
+            # lost MCP connections are replaced when the next run starts
             active_mcp_servers: List[MCPServerInstance]
-            active_mcp_servers, mcp_stack = await setup_mcp_servers(
-                print_func=self.print,
-                agent_name=self.agent_name
-            )
-
-            async with mcp_stack:
-                model_to_use: Any # Type hint for clarity
-                # LiteLLM needs more than the model name in Agents SDK
-                if self.use_litellm:
-                    self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using LiteLLM backend for model: {self.model_name}")
-                    litellm_base_url = self.base_url if self.base_url != OPENAI_DEFAULT_URL else None
-                    model_to_use = LitellmModel(
-                        model=self.model_name,
-                        api_key=self.api_key,
-                        base_url=litellm_base_url
-                    )
-                else:
-                     model_to_use = self.model_name # Use the string name for standard OpenAI client
-                # TODO: Extend or make generic for more settings
-                model_settings_dict: Dict[str, Any] = {}
-                if self.max_tokens is not None:
-                    model_settings_dict["max_tokens"] = self.max_tokens
-                if self.extra_headers is not None:
-                    model_settings_dict["extra_headers"] = self.extra_headers
-                model_settings_obj = ModelSettings(**model_settings_dict)
-
-                agent_kwargs: Dict[str, Any] = {
-                    "name": self.agent_name,
-                    "instructions": self.instructions,
-                    "model": model_to_use,
-                    "tools": self.static_tools,
-                    "mcp_servers": active_mcp_servers,
-                    "model_settings": model_settings_obj,
-                }
-
-                underlying_agent = UnderlyingAgent(**agent_kwargs)
+            async with self.mcp_servers.session() as active_mcp_servers:
+                underlying_agent = self._build_underlying_agent(active_mcp_servers)
 
                 self.print(f"Running {self.agent_name} with prompt...")
                 result = await UnderlyingRunner.run(underlying_agent, prompt)
-                self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Agent run completed.")
+            logger.debug("[OpenAIAgent %s]: Agent run completed.", self.agent_name)
 
         except Exception as e:
             error_msg = f"ERROR [OpenAIAgent {self.agent_name}]: Agent run failed: {e}"
             self.print(error_msg)
-            self.print(traceback.format_exc())
+            logger.debug("[OpenAIAgent %s]: Traceback of failed run", self.agent_name, exc_info=True)
             return f"Error during agent execution: {e}"
 
         # Process result and print final output once
         final_str = self._process_agent_result(result)
         self.print(f"Response from {self.agent_name}: {final_str}")
+        # fallback text from runs without final output is not worth repeating
+        if self._final_output(result):
+            self._cache_response(prompt, final_str)
 
         return final_str
 
 
     async def _run_streaming_internal(self, prompt: str) -> str:
-        final_output_chunks: List[str] = []
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            self.print(f"Final Response from {self.agent_name} (cached): {cached}")
+            return cached
+
+        final_output = io.StringIO()
         last_event_was_delta = False
+        stdout = sys.stdout
+        unflushed_deltas = 0
+        # flushes deltas still buffered once the stream pauses
+        flush_timer: Optional[asyncio.TimerHandle] = None
+
+        def flush_stdout() -> None:
+            nonlocal unflushed_deltas, flush_timer
+            if flush_timer is not None:
+                flush_timer.cancel()
+                flush_timer = None
+            unflushed_deltas = 0
+            stdout.flush()
 
         self.print(f"Running {self.agent_name} with prompt (streaming)...")
         try:
             active_mcp_servers: List[MCPServerInstance]
-            active_mcp_servers, mcp_stack = await setup_mcp_servers(
-                print_func=self.print,
-                agent_name=self.agent_name
-            )
-
-            async with mcp_stack:
-                model_to_use: Any
-                if self.use_litellm:
-                    self.print(f"INFO [OpenAIAgent {self.agent_name}]: Using LiteLLM backend for model: {self.model_name} (streaming)")
-                    litellm_base_url = self.base_url if self.base_url != OPENAI_DEFAULT_URL else None
-                    model_to_use = LitellmModel(
-                        model=self.model_name,
-                        api_key=self.api_key,
-                        base_url=litellm_base_url
-                    )
-                else:
-                     model_to_use = self.model_name
-
-                model_settings_dict: Dict[str, Any] = {}
-                if self.max_tokens is not None:
-                    model_settings_dict["max_tokens"] = self.max_tokens
-                if self.extra_headers is not None:
-                    model_settings_dict["extra_headers"] = self.extra_headers
-                model_settings_obj = ModelSettings(**model_settings_dict)
-
-                agent_kwargs: Dict[str, Any] = {
-                    "name": self.agent_name,
-                    "instructions": self.instructions,
-                    "model": model_to_use,
-                    "tools": self.static_tools,
-                    "mcp_servers": active_mcp_servers,
-                    "model_settings": model_settings_obj,
-                }
-                # Create the *OpenAI* Agent (renamed to avoid clash)
-                underlying_agent = UnderlyingAgent(**agent_kwargs)
+            async with self.mcp_servers.session() as active_mcp_servers:
+                underlying_agent = self._build_underlying_agent(active_mcp_servers)
 
                 run_result_streaming = UnderlyingRunner.run_streamed(underlying_agent, prompt)
                 stream = run_result_streaming.stream_events()
-                event = None
 
                 # TODO: Refactor some stream handling into common routine across backends? Code verbose
                 async for event in stream:
                     if event.type == "raw_response_event":
-                        if isinstance(event.data, ResponseTextDeltaEvent):
+                        # text deltas are the bulk of events, exact type check is enough
+                        if type(event.data) is ResponseTextDeltaEvent:
                             delta_value = event.data.delta
-                            print(delta_value, end="", flush=True)
-                            final_output_chunks.append(delta_value)
+                            stdout.write(delta_value)
+                            final_output.write(delta_value)
                             last_event_was_delta = True
-                    elif event.type == "run_item_stream_event":
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-
-                        if event.name == "tool_called":
-                            tool_call_info = getattr(event.item, 'tool_call', None)
-                            if tool_call_info:
-                                self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Starting tool call: {getattr(tool_call_info, 'name', 'N/A')} with args: {getattr(tool_call_info, 'arguments', '{}')}")
-                            else:
-                                self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Starting tool call (details unavailable in event.item)")
-                        elif event.name == "tool_output":
-                            tool_output = getattr(event.item, 'output', 'N/A')
-                            self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Finished tool call. Output: {str(tool_output)[:100]}...")
-                        elif event.name == "message_output_created":
-                            # message_text = ItemHelpers.text_message_output(event.item) # Can be verbose
-                            self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Message output item created.")
-                            pass
-                        elif event.name == "run_completed":
-                            self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Agent stream processing finished (run_item_stream_event: {event.name}).")
-                        else:
-                            self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Received run item event: {event.name}")
-
-                    elif event.type == "agent_updated_stream_event":
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-                        self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Agent updated to: {event.new_agent.name}")
-                    else:
-                        if last_event_was_delta:
-                            print("")
-                            last_event_was_delta = False
-                        self.print(f"DEBUG [OpenAIAgent {self.agent_name}]: Received unknown event type: {event.type}")
+                            # flush every few deltas, or shortly after the first unflushed one
+                            unflushed_deltas += 1
+                            if unflushed_deltas >= STREAM_FLUSH_DELTAS:
+                                flush_stdout()
+                            elif flush_timer is None:
+                                flush_timer = asyncio.get_running_loop().call_later(STREAM_FLUSH_INTERVAL, flush_stdout)
+                        continue
+
+                    if last_event_was_delta:
+                        print("", flush=True)
+                        last_event_was_delta = False
+                    if logger.isEnabledFor(logging.DEBUG):
+                        self._stream_event_loggers.get(event.type, OpenAIAgent._log_unknown_event)(self, event)
 
                 if last_event_was_delta:
-                    print("")
+                    print("", flush=True)
 
         except Exception as e:
             if last_event_was_delta:
-                print("")
+                print("", flush=True)
             error_msg = f"ERROR [OpenAIAgent {self.agent_name}]: Agent stream failed: {e}"
             self.print(error_msg)
-            self.print(traceback.format_exc())
+            logger.debug("[OpenAIAgent %s]: Traceback of failed run", self.agent_name, exc_info=True)
             return f"Error during agent streaming execution: {e}"
+        finally:
+            if flush_timer is not None:
+                flush_timer.cancel()
 
         # Create the final output from all the bits we've received
-        final_output_str = "".join(final_output_chunks)
+        final_output_str = final_output.getvalue()
 
         self.print(f"Final Response from {self.agent_name} (streaming collected): {final_output_str}")
+        if final_output_str:
+            self._cache_response(prompt, final_output_str)
 
         return final_output_str
 
+    def _log_run_item_event(self, event: Any) -> None:
+        if event.name == "tool_called":
+            tool_call_info = getattr(event.item, 'tool_call', None)
+            if tool_call_info:
+                logger.debug("[OpenAIAgent %s]: Starting tool call: %s with args: %s", self.agent_name, getattr(tool_call_info, 'name', 'N/A'), getattr(tool_call_info, 'arguments', '{}'))
+            else:
+                logger.debug("[OpenAIAgent %s]: Starting tool call (details unavailable in event.item)", self.agent_name)
+        elif event.name == "tool_output":
+            tool_output = getattr(event.item, 'output', 'N/A')
+            logger.debug("[OpenAIAgent %s]: Finished tool call. Output: %s...", self.agent_name, str(tool_output)[:100])
+        elif event.name == "message_output_created":
+            # message_text = ItemHelpers.text_message_output(event.item) # Can be verbose
+            logger.debug("[OpenAIAgent %s]: Message output item created.", self.agent_name)
+        elif event.name == "run_completed":
+            logger.debug("[OpenAIAgent %s]: Agent stream processing finished (run_item_stream_event: %s).", self.agent_name, event.name)
+        else:
+            logger.debug("[OpenAIAgent %s]: Received run item event: %s", self.agent_name, event.name)
+
+    def _log_agent_updated_event(self, event: Any) -> None:
+        logger.debug("[OpenAIAgent %s]: Agent updated to: %s", self.agent_name, event.new_agent.name)
+
+    def _log_unknown_event(self, event: Any) -> None:
+        logger.debug("[OpenAIAgent %s]: Received unknown event type: %s", self.agent_name, event.type)
+
+    # DEBUG logging of stream events other than text deltas, by event type
+    _stream_event_loggers: Dict[str, Callable[["OpenAIAgent", Any], None]] = {
+        "run_item_stream_event": _log_run_item_event,
+        "agent_updated_stream_event": _log_agent_updated_event,
+    }
+
+    async def aclose(self) -> None:
+        """Disconnects the MCP servers kept open across runs."""
+        await self.mcp_servers.aclose()
+        self._underlying_agent = None
+
+    def _agent_span(self) -> Any:
+        """Opens the span a run's SDK spans nest under, naming the agent as a span attribute."""
+        _configure_logfire()
+        return logfire.span("OpenAIAgent {agent_name}", agent_name=self.agent_name)
+
     async def run(self, prompt: str) -> str:
         """
         Runs the agent with the given prompt, potentially overriding to streaming
@@ -362,16 +644,17 @@ class OpenAIAgent(MaestroAgent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-        streaming_override = os.getenv("MAESTRO_OPENAI_STREAMING", "auto").lower()
+        streaming_override = self.streaming_override
 
-        if streaming_override == "true":
-            self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=true, overriding run() to use streaming.")
-            return await self._run_streaming_internal(prompt)
-        elif streaming_override == "false":
-            self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=false, forcing non-streaming.")
-            return await self._run_internal(prompt)
-        else: # auto or unset
-            return await self._run_internal(prompt)
+        with self._agent_span():
+            if streaming_override == "true":
+                self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=true, overriding run() to use streaming.")
+                return await self._run_streaming_internal(prompt)
+            elif streaming_override == "false":
+                self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=false, forcing non-streaming.")
+                return await self._run_internal(prompt)
+            else: # auto or unset
+                return await self._run_internal(prompt)
 
 
     async def run_streaming(self, prompt: str) -> str:
@@ -382,13 +665,14 @@ class OpenAIAgent(MaestroAgent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-        streaming_override = os.getenv("MAESTRO_OPENAI_STREAMING", "auto").lower()
-
-        if streaming_override == "true":
-            self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=true, forcing streaming.")
-            return await self._run_streaming_internal(prompt)
-        elif streaming_override == "false":
-            self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=false, overriding run_streaming() to use non-streaming.")
-            return await self._run_internal(prompt)
-        else: # auto or unset
-            return await self._run_streaming_internal(prompt)
\ No newline at end of file
+        streaming_override = self.streaming_override
+
+        with self._agent_span():
+            if streaming_override == "true":
+                self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=true, forcing streaming.")
+                return await self._run_streaming_internal(prompt)
+            elif streaming_override == "false":
+                self.print(f"INFO [OpenAIAgent {self.agent_name}]: MAESTRO_OPENAI_STREAMING=false, overriding run_streaming() to use non-streaming.")
+                return await self._run_internal(prompt)
+            else: # auto or unset
+                return await self._run_streaming_internal(prompt)
\ No newline at end of file
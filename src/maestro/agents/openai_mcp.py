@@ -2,90 +2,381 @@
 
 import os
 import shlex
-from contextlib import AsyncExitStack
-from typing import List, Optional, Union, Tuple, Callable
+import asyncio
+import contextlib
+import functools
+import logging
+from typing import AsyncIterator, Dict, Final, List, NamedTuple, Optional, Sequence, Tuple, Union, Callable
 
 from agents.mcp import MCPServerSse, MCPServerStdio
 
 # MCP Servers can be of either type
 MCPServerInstance = Union[MCPServerSse, MCPServerStdio]
 
+# Upper bound on concurrent list_tools requests when warming tool caches
+MCP_DISCOVERY_CONCURRENCY: Final[int] = 8
+
+# Seconds to wait for each MCP server to connect, see MAESTRO_MCP_CONNECT_TIMEOUT
+MCP_DEFAULT_CONNECT_TIMEOUT: Final[float] = 10.0
+
+# Endpoint prefixes that select a remote (SSE) server instead of a local command
+_HTTP_PREFIXES: Final[Tuple[str, ...]] = ("http://", "https://")
+
+logger = logging.getLogger(__name__)
+
+
+class _MCPEndpoint(NamedTuple):
+    """An MCP endpoint definition, classified once when parsed."""
+    definition: str
+    server_type: str  # "SSE" or "Stdio"
+    argv: Tuple[str, ...]  # command and args for Stdio, empty if invalid or SSE
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_mcp_endpoints(mcp_endpoints_str: str) -> Tuple[_MCPEndpoint, ...]:
+    """Parses MAESTRO_MCP_ENDPOINTS; cached as the variable rarely changes within a process."""
+    # List of mcp servers, comma separated. either executable+args or a URL
+    endpoints: List[_MCPEndpoint] = []
+    for ep in mcp_endpoints_str.split(','):
+        definition = ep.strip()
+        if not definition:
+            continue
+        if definition.startswith(_HTTP_PREFIXES):
+            endpoints.append(_MCPEndpoint(definition, "SSE", ()))
+            continue
+        try:
+            argv = tuple(shlex.split(definition))
+        except ValueError:
+            argv = ()
+        endpoints.append(_MCPEndpoint(definition, "Stdio", argv))
+    return tuple(endpoints)
+
+
+def _connect_timeout(print_func: Callable, agent_name: str) -> float:
+    """Reads MAESTRO_MCP_CONNECT_TIMEOUT, falling back to the default when unset or invalid."""
+    timeout_str = os.getenv("MAESTRO_MCP_CONNECT_TIMEOUT")
+    if timeout_str:
+        try:
+            timeout = float(timeout_str)
+            if timeout > 0:
+                return timeout
+        except ValueError:
+            pass
+        print_func(f"WARN [{agent_name} - MCP Setup]: MAESTRO_MCP_CONNECT_TIMEOUT must be a positive number, but got '{timeout_str}'. Using {MCP_DEFAULT_CONNECT_TIMEOUT}s.")
+    return MCP_DEFAULT_CONNECT_TIMEOUT
+
+
+class _ServerOwner:
+    """
+    Keeps one MCP server connected from a dedicated task.
+
+    The MCP transports open anyio cancel scopes in __aenter__ that must be
+    closed from the same task, so the owner task both enters and exits the
+    server context while callers in other tasks use the connected server.
+    """
+
+    __slots__ = ("server", "endpoint", "_stop", "_task")
+
+    def __init__(self, server: MCPServerInstance, endpoint: Tuple[int, _MCPEndpoint]) -> None:
+        self.server = server
+        # position and definition in MAESTRO_MCP_ENDPOINTS, to reconnect it
+        self.endpoint = endpoint
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, timeout: Optional[float] = None) -> None:
+        """
+        Connects the server, raising any connection error to the caller.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the connection,
+                after which the attempt is abandoned with TimeoutError.
+        """
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._own(ready))
+        try:
+            await asyncio.wait_for(asyncio.shield(ready), timeout)
+        except BaseException:
+            # abandon the attempt in the owner task, which cleans up after itself
+            self._task.cancel()
+            raise
+
+    async def _own(self, ready: asyncio.Future) -> None:
+        try:
+            async with self.server:
+                ready.set_result(None)
+                await self._stop.wait()
+        except BaseException as err:
+            if ready.done():
+                raise
+            if isinstance(err, asyncio.CancelledError):
+                ready.cancel()
+                raise
+            ready.set_exception(err)
+
+    @property
+    def alive(self) -> bool:
+        """False once the owner task has ended, e.g. it was cancelled or its context failed."""
+        return self._task is not None and not self._task.done()
+
+    async def stop(self) -> None:
+        """Disconnects the server from its owner task."""
+        self._stop.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except BaseException:
+                pass
+
+
+class _SharedServers:
+    """MCP servers connected for one endpoint configuration on one event loop."""
+
+    __slots__ = ("key", "owners", "leases", "connected", "lock")
+
+    def __init__(self, key: Tuple[str, asyncio.AbstractEventLoop]) -> None:
+        self.key = key
+        self.owners: List[_ServerOwner] = []
+        self.leases = 0
+        self.connected = False
+        self.lock = asyncio.Lock()
+
+
+# Connections shared by every agent with the same MAESTRO_MCP_ENDPOINTS on the
+# same event loop, so N agents cost one handshake (and one subprocess) per endpoint
+_SHARED_SERVERS: Dict[Tuple[str, asyncio.AbstractEventLoop], _SharedServers] = {}
+
+
+def _lease_servers(mcp_endpoints_str: str, loop: asyncio.AbstractEventLoop) -> _SharedServers:
+    key = (mcp_endpoints_str, loop)
+    shared = _SHARED_SERVERS.get(key)
+    if shared is None:
+        shared = _SHARED_SERVERS[key] = _SharedServers(key)
+    shared.leases += 1
+    return shared
+
+
+def _release_servers(shared: _SharedServers) -> bool:
+    """Drops a lease, returning True when it was the last one."""
+    shared.leases -= 1
+    if shared.leases > 0:
+        return False
+    if _SHARED_SERVERS.get(shared.key) is shared:
+        del _SHARED_SERVERS[shared.key]
+    return True
+
+
 # Uses openai agent specific types - though concepts are similar across implementations
 # TODO: can this be refactored so we can support more types of agents
-async def setup_mcp_servers(
-    print_func: Callable = print,
-    agent_name: str = "GenericAgent"
-) -> Tuple[List[MCPServerInstance], AsyncExitStack]:
+class MCPServerManager:
     """
-    Parses MAESTRO_MCP_ENDPOINTS, connects to MCP servers (SSE/Stdio),
-    and returns a list of active server instances and an AsyncExitStack
-    to manage their lifecycles.
-
-    Args:
-        print_func (Callable): Function used for logging output.
-        agent_name (str): Name of the agent requesting setup (for logging).
-
-    Returns:
-        Tuple[List[MCPServerInstance], AsyncExitStack]:
-            - A list of successfully connected MCPServerSse/MCPServerStdio instances.
-            - An AsyncExitStack managing the context of these servers.
-            The caller MUST manage this stack (e.g., using 'async with').
+    Connects the MCP servers in MAESTRO_MCP_ENDPOINTS on first use and keeps
+    them connected across agent runs, instead of reconnecting on every run.
+    Managers configured with the same endpoints share the connections, which
+    are closed once the last of them has called aclose() and no run still
+    uses them.
+
+    The connections belong to the event loop they were opened on; when called
+    from a different loop (e.g. a new asyncio.run()) the servers are reconnected.
     """
-    active_servers: List[MCPServerInstance] = []
-    stack = AsyncExitStack()
 
-    # List of mcp servers, comma separated. either executable+args or a URL
-    mcp_endpoints_str = os.getenv("MAESTRO_MCP_ENDPOINTS", "")
-    endpoint_definitions = [ep.strip() for ep in mcp_endpoints_str.split(',') if ep.strip()]
+    __slots__ = ("print_func", "agent_name", "_shared", "_loop")
+
+    def __init__(self, print_func: Callable = print, agent_name: str = "GenericAgent") -> None:
+        self.print_func = print_func
+        self.agent_name = agent_name
+        self._reset()
+
+    def _reset(self) -> None:
+        self._shared: Optional[_SharedServers] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __getstate__(self) -> dict:
+        # live connections and loop-bound primitives are never pickled
+        return {"print_func": self.print_func, "agent_name": self.agent_name}
 
-    if not endpoint_definitions:
-        print_func(f"DEBUG [{agent_name} - MCP Setup]: No MCP endpoints configured in MAESTRO_MCP_ENDPOINTS.")
-        return active_servers, stack
+    def __setstate__(self, state: dict) -> None:
+        self.print_func = state["print_func"]
+        self.agent_name = state["agent_name"]
+        self._reset()
 
-    print_func(f"DEBUG [{agent_name} - MCP Setup]: Attempting MCP connections: {endpoint_definitions}...")
+    def _lease(self) -> _SharedServers:
+        """Returns the servers this manager holds a lease on for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # connections opened on another (likely closed) loop are unusable
+            if self._shared is not None:
+                _release_servers(self._shared)
+            self._reset()
+            self._loop = loop
+        if self._shared is None:
+            self._shared = _lease_servers(os.getenv("MAESTRO_MCP_ENDPOINTS", ""), loop)
+        return self._shared
 
-    for i, endpoint_def in enumerate(endpoint_definitions):
-        server_name_base = f"{agent_name}_MCP_Server_{i+1}"
-        server: Optional[MCPServerInstance] = None
-        server_type = "Unknown"
-        server_id = endpoint_def
+    async def get_servers(self) -> List[MCPServerInstance]:
+        """
+        Returns the connected MCP servers, connecting them on first use.
+        Runs should use session() instead, so the servers outlive an aclose()
+        made while the run is in progress.
 
+        Returns:
+            List[MCPServerInstance]: The successfully connected servers.
+        """
+        return await self._connected(self._lease())
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[List[MCPServerInstance]]:
+        """
+        Holds the connected MCP servers for the duration of one run. Each run
+        takes its own lease, so closing the manager or another run failing
+        never disconnects servers a run is still using.
+
+        Yields:
+            List[MCPServerInstance]: The successfully connected servers.
+        """
+        shared = self._lease()
+        shared.leases += 1
         try:
-            if endpoint_def.startswith(("http://", "https://")):
-                # Remote SSE Server - http
-                server_type = "SSE"
-                server = MCPServerSse(name=f"{server_name_base}_SSE", params={"url": endpoint_def})
+            yield await self._connected(shared)
+        finally:
+            await self._drop_lease(shared)
+
+    async def _connected(self, shared: _SharedServers) -> List[MCPServerInstance]:
+        async with shared.lock:
+            if not shared.connected:
+                endpoints = list(enumerate(_parse_mcp_endpoints(shared.key[0])))
+                shared.owners = await self._connect(endpoints)
+                await self._prefetch_tools(shared.owners)
+                shared.connected = True
             else:
-                # Local Stdio Server (local executable to run, with args)
-                server_type = "Stdio"
-                parts = shlex.split(endpoint_def)
-                if not parts:
-                    print_func(f"WARN [{agent_name} - MCP Setup]: Skipping invalid empty MCP command: '{endpoint_def}'")
-                    continue
-                command, args = parts[0], parts[1:]
-                current_env = os.environ.copy()
-                server = MCPServerStdio(
-                    name=f"{server_name_base}_Stdio",
-                    params={"command": command, "args": args, "env": current_env},
-                    cache_tools_list=True
-                )
-                server_id = endpoint_def
-
-
-            await stack.enter_async_context(server)
-            active_servers.append(server)
-            print_func(f"INFO [{agent_name} - MCP Setup]: MCP Server ({server_type}) connected: {server.name} ({server_id})")
-
-        except ConnectionRefusedError:
-            print_func(f"WARN [{agent_name} - MCP Setup]: MCP Server ({server_type}) connection refused: {server_name_base} ({server_id})")
-        except FileNotFoundError:
-            print_func(f"WARN [{agent_name} - MCP Setup]: MCP Server ({server_type}) command not found: {server_name_base} ({server_id})")
-        except Exception as conn_err:
-            print_func(f"WARN [{agent_name} - MCP Setup]: Failed MCP connection {server_name_base} ({server_id}): {conn_err}")
-
-    if not active_servers and endpoint_definitions:
-        print_func(f"WARN [{agent_name} - MCP Setup]: Failed to connect to any configured MCP servers.")
-    elif active_servers:
-        print_func(f"INFO [{agent_name} - MCP Setup]: Successfully connected to {len(active_servers)} MCP server(s).")
-
-    return active_servers, stack
\ No newline at end of file
+                dead = [owner for owner in shared.owners if not owner.alive]
+                if dead:
+                    # only the lost connections are replaced, servers in use stay
+                    logger.debug("[%s - MCP Setup]: %d MCP connection(s) lost, reconnecting.", self.agent_name, len(dead))
+                    for owner in dead:
+                        await owner.stop()
+                    replaced = {owner.endpoint[0]: owner for owner in await self._connect([owner.endpoint for owner in dead])}
+                    await self._prefetch_tools(list(replaced.values()))
+                    shared.owners = [
+                        replaced.get(owner.endpoint[0]) if owner in dead else owner
+                        for owner in shared.owners
+                    ]
+                    shared.owners = [owner for owner in shared.owners if owner is not None]
+        return [owner.server for owner in shared.owners]
+
+    async def _drop_lease(self, shared: _SharedServers) -> None:
+        """Releases a lease, disconnecting the servers when it was the last one."""
+        if not _release_servers(shared):
+            return
+        if shared.key[1] is asyncio.get_running_loop():
+            for owner in reversed(shared.owners):
+                await owner.stop()
+        shared.owners = []
+        shared.connected = False
+
+    async def _connect(self, endpoint_definitions: Sequence[Tuple[int, _MCPEndpoint]]) -> List[_ServerOwner]:
+        agent_name = self.agent_name
+        print_func = self.print_func
+
+        if not endpoint_definitions:
+            logger.debug("[%s - MCP Setup]: No MCP endpoints configured in MAESTRO_MCP_ENDPOINTS.", agent_name)
+            return []
+
+        logger.debug("[%s - MCP Setup]: Attempting MCP connections: %s...", agent_name, [ep.definition for _, ep in endpoint_definitions])
+
+        # Create all servers first, then connect them concurrently
+        pending: List[Tuple[Tuple[int, _MCPEndpoint], str, MCPServerInstance]] = []
+        # Tool lists are fetched once per connection unless disabled, e.g. for
+        # servers whose tools change while connected
+        cache_tools = os.getenv("MAESTRO_MCP_CACHE_TOOLS", "true").lower() != "false"
+        # Stdio servers only read their environment, so one snapshot serves all
+        stdio_env = os.environ.copy()
+        for endpoint in endpoint_definitions:
+            i, (endpoint_def, server_type, argv) = endpoint
+            server_name_base = f"{agent_name}_MCP_Server_{i+1}"
+
+            try:
+                if server_type == "SSE":
+                    server = MCPServerSse(
+                        name=f"{server_name_base}_SSE",
+                        params={"url": endpoint_def},
+                        cache_tools_list=cache_tools
+                    )
+                else:
+                    if not argv:
+                        print_func(f"WARN [{agent_name} - MCP Setup]: Skipping invalid MCP command: '{endpoint_def}'")
+                        continue
+                    server = MCPServerStdio(
+                        name=f"{server_name_base}_Stdio",
+                        params={"command": argv[0], "args": list(argv[1:]), "env": stdio_env},
+                        cache_tools_list=cache_tools
+                    )
+            except Exception as conn_err:
+                print_func(f"WARN [{agent_name} - MCP Setup]: Failed MCP connection {server_name_base} ({endpoint_def}): {conn_err}")
+                continue
+            pending.append((endpoint, server_name_base, server))
+
+        connect_timeout = _connect_timeout(print_func, agent_name)
+
+        async def connect(endpoint: Tuple[int, _MCPEndpoint], server_name_base: str,
+                          server: MCPServerInstance) -> Tuple[Optional[_ServerOwner], str]:
+            # Outcomes are reported after all connections settle, in endpoint order
+            endpoint_def, server_type = endpoint[1].definition, endpoint[1].server_type
+            try:
+                owner = _ServerOwner(server, endpoint)
+                await owner.start(connect_timeout)
+                return owner, f"INFO [{agent_name} - MCP Setup]: MCP Server ({server_type}) connected: {server.name} ({endpoint_def})"
+            except asyncio.TimeoutError:
+                return None, f"WARN [{agent_name} - MCP Setup]: MCP Server ({server_type}) connection timed out after {connect_timeout}s: {server_name_base} ({endpoint_def})"
+            except ConnectionRefusedError:
+                return None, f"WARN [{agent_name} - MCP Setup]: MCP Server ({server_type}) connection refused: {server_name_base} ({endpoint_def})"
+            except FileNotFoundError:
+                return None, f"WARN [{agent_name} - MCP Setup]: MCP Server ({server_type}) command not found: {server_name_base} ({endpoint_def})"
+            except Exception as conn_err:
+                return None, f"WARN [{agent_name} - MCP Setup]: Failed MCP connection {server_name_base} ({endpoint_def}): {conn_err}"
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(connect(*args)) for args in pending]
+
+        owners: List[_ServerOwner] = []
+        for task in tasks:
+            owner, message = task.result()
+            print_func(message)
+            if owner is not None:
+                owners.append(owner)
+
+        if not owners:
+            print_func(f"WARN [{agent_name} - MCP Setup]: Failed to connect to any configured MCP servers.")
+        else:
+            print_func(f"INFO [{agent_name} - MCP Setup]: Successfully connected to {len(owners)} MCP server(s).")
+
+        return owners
+
+    async def _prefetch_tools(self, owners: List[_ServerOwner]) -> None:
+        """
+        Fills the tool cache of cache-enabled servers in one concurrent pass,
+        so the first run does not list each server's tools one after another.
+        """
+        semaphore = asyncio.Semaphore(MCP_DISCOVERY_CONCURRENCY)
+
+        async def prefetch(server: MCPServerInstance) -> None:
+            async with semaphore:
+                try:
+                    await server.list_tools()
+                except Exception as err:
+                    self.print_func(f"WARN [{self.agent_name} - MCP Setup]: Failed to list tools for {server.name}: {err}")
+
+        async with asyncio.TaskGroup() as tg:
+            for owner in owners:
+                if getattr(owner.server, "cache_tools_list", False):
+                    tg.create_task(prefetch(owner.server))
+
+    async def aclose(self) -> None:
+        """
+        Releases this manager's servers, disconnecting them once no other
+        manager or run uses them; the next run connects them again.
+        """
+        shared = self._shared
+        self._shared = None
+        if shared is not None:
+            await self._drop_lease(shared)
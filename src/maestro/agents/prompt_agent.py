@@ -1,9 +1,6 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
-from dotenv import load_dotenv
-load_dotenv()
-
 from maestro.agents.agent import Agent
 
 class PromptAgent(Agent):
@@ -1,15 +1,13 @@
 #! /usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
-import os, dotenv
+import os
 import asyncio
 import requests
 from requests import RequestException
 
 from maestro.agents.agent import Agent
 
-dotenv.load_dotenv()
-
 class RemoteAgent(Agent):
     """
     RemoteAgent extends the Agent class to load and run a specific agent.
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
-from dotenv import load_dotenv
-load_dotenv()
+import asyncio
+from collections import OrderedDict
 
 from maestro.agents.agent import Agent
-from opik.evaluation.metrics import AnswerRelevance, Hallucination
+
+# Scored (prompt, response, context) triples remembered per agent
+SCORE_CACHE_MAXSIZE = 256
 
 class ScoringAgent(Agent):
     """
@@ -21,6 +23,9 @@ class ScoringAgent(Agent):
             self._litellm_model = raw_model
         else:
             self._litellm_model = f"ollama/{raw_model}"
+        # judge calls are slow LLM round trips, replays and event loops often
+        # score the same response again
+        self._scores = OrderedDict()
 
     async def run(
         self,
@@ -43,27 +48,48 @@ class ScoringAgent(Agent):
         assert isinstance(response, str), (
             f"ScoringAgent only supports string responses, got {type(response).__name__}"
         )
+        # opik pulls in its LLM client stack, only load it once scoring runs
+        from opik.evaluation.metrics import AnswerRelevance, Hallucination
+
         response_text = response
         ctx = context or [prompt]
 
+        scores_cache = getattr(self, "_scores", None)
+        if scores_cache is None:
+            # agents restored from pickles saved before the cache existed
+            scores_cache = self._scores = OrderedDict()
+        # context items may be unhashable (e.g. dicts), key on their text
+        key = (str(prompt), response_text, tuple(map(str, ctx)))
+        scores = scores_cache.get(key)
+
         try:
-            rel_res = AnswerRelevance(model=self._litellm_model).score(
-                input=prompt,
-                output=response_text,
-                context=ctx
-            )
-            hall_res = Hallucination(model=self._litellm_model).score(
-                input=prompt,
-                output=response_text,
-                context=ctx
-            )
+            if scores is None:
+                # the judges are independent blocking calls, run them side by side
+                rel_res, hall_res = await asyncio.gather(*(
+                    asyncio.to_thread(
+                        metric(model=self._litellm_model).score,
+                        input=prompt,
+                        output=response_text,
+                        context=ctx
+                    )
+                    for metric in (AnswerRelevance, Hallucination)
+                ))
+                scores = (getattr(rel_res, "value", rel_res), getattr(hall_res, "value", hall_res))
 
-            rel  = getattr(rel_res, "value", rel_res)
-            hall = getattr(hall_res, "value", hall_res)
+            rel, hall = scores
 
             metrics_line = f"relevance: {rel:.2f}, hallucination: {hall:.2f}"
             self.print(f"{response_text}\n[{metrics_line}]")
         except Exception as e:
             self.print(f"[ScoringAgent] Warning: could not calculate metrics: {e}")
+            return response
+
+        # only scores that could be reported are remembered
+        if key in scores_cache:
+            scores_cache.move_to_end(key)
+        else:
+            scores_cache[key] = scores
+            if len(scores_cache) > SCORE_CACHE_MAXSIZE:
+                scores_cache.popitem(last=False)
 
         return response
@@ -2,14 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import functools
 import os
-from dotenv import load_dotenv
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from maestro.agents.agent import Agent
 
-load_dotenv()
+@functools.lru_cache(maxsize=4)
+def _slack_client(token: str) -> WebClient:
+    """Returns the WebClient for a bot token, shared by every post and agent."""
+    return WebClient(token=token)
 
 def post_message_to_slack(channel_id, message):
     """
@@ -24,7 +27,7 @@ def post_message_to_slack(channel_id, message):
         print("Error: SLACK_BOT_TOKEN environment variable not set.")
         return
 
-    client = WebClient(token=slack_token)
+    client = _slack_client(slack_token)
 
     try:
         result = client.chat_postMessage(channel=channel_id, text=message)
@@ -56,8 +59,11 @@ class SlackAgent(Agent):
         """
 
         self.print(f"Running {self.agent_name}...\n")
-        answer = post_message_to_slack(self.channel, prompt)
-        self.print(f"Response from {self.agent_name}: {answer}\n")
+        # the Slack client is synchronous, keep it off the event loop
+        await asyncio.to_thread(post_message_to_slack, self.channel, prompt)
+        self.print(f"Response from {self.agent_name}: {prompt}\n")
+        # the posted message is the step output, so later steps can use it
+        return prompt
 
     async def run_streaming(self, prompt: str) -> str:
         """
@@ -65,7 +71,4 @@ class SlackAgent(Agent):
         Args:
             prompt (str): The prompt to run the agent with.
         """
-
-        self.print(f"Running {self.agent_name}...\n")
-        answer = post_message_to_slack(self.channel, prompt)
-        self.print(f"Response from {self.agent_name}: {answer}\n")
+        return await self.run(prompt)
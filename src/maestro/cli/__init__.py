@@ -16,9 +16,6 @@
 
 import os
 import sys
-from dotenv import load_dotenv
-
-load_dotenv()
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../cli")
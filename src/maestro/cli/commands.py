@@ -154,7 +154,7 @@ class ValidateCmd(Command):
     # private
 
     def __discover_schema_file(self, yaml_file):
-        yaml_data = parse_yaml(yaml_file)
+        yaml_data = parse_yaml(yaml_file, shared=True)
         if isinstance(yaml_data, list) and len(yaml_data) > 0:
             yaml_data = yaml_data[0]
         kind = yaml_data.get('kind')
@@ -466,7 +466,7 @@ class MermaidCmd(Command):
         Returns:
             int: Return code (0 for success, 1 for failure)
         """
-        workflow_yaml = parse_yaml(self.WORKFLOW_FILE())
+        workflow_yaml = parse_yaml(self.WORKFLOW_FILE(), shared=True)
         try:            
             mermaid = self.__mermaid(workflow_yaml)
             if not self.silent():
@@ -14,10 +14,18 @@
 
 """Common utility functions and classes for the CLI."""
 
+import copy
+import functools
+import os
 import sys
 import yaml
 from random import randint
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 VERBOSE = False
 
 class Colors:
@@ -32,20 +40,31 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-def parse_yaml(file_path):
+@functools.lru_cache(maxsize=128)
+def _load_yaml(path, mtime_ns, size):
+    # keyed on mtime and size so an edited file is parsed again
+    with open(path, "r") as file:
+        return list(yaml.load_all(file, Loader=_SafeLoader))
+
+def parse_yaml(file_path, shared=False):
     """Parse a YAML file and return a list of dictionaries.
     
     Args:
         file_path (str): The path to the YAML file.
+        shared (bool): Return the cached documents themselves instead of a
+            copy; callers passing True must not modify them.
         
     Returns:
         list: A list of dictionaries containing the parsed YAML data.
     """
     yaml_data = "--"
     try:
-        with open(file_path, "r") as file:
-            yaml_data = list(yaml.safe_load_all(file))
-        return yaml_data
+        stat = os.stat(file_path)
+        yaml_data = _load_yaml(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if shared:
+            return yaml_data
+        # workflows and agents modify their definitions, give them their own
+        return copy.deepcopy(yaml_data)
     except Exception as e:
         Console.error("Could not parse YAML file: {file_path}")
 
@@ -37,7 +37,7 @@ def deploy_agents_workflow_streamlit(agents_file, workflow_file):
         agents_file (str): Path to the agents configuration file
         workflow_file (str): Path to the workflow configuration file
     """
-    workflow_yaml = parse_yaml(workflow_file)
+    workflow_yaml = parse_yaml(workflow_file, shared=True)
     
     # Set page configuration
     st.set_page_config(
@@ -14,9 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os, dotenv, inspect, asyncio, shutil, subprocess, yaml, tempfile
+import os, inspect, asyncio, shutil, subprocess, yaml, tempfile
 
-dotenv.load_dotenv()
 
 def env_array_docker(str_envs):
     """
@@ -21,17 +21,24 @@ class Mermaid:
         self.workflow = workflow
         self.kind = kind
         self.orientation = orientation
+        # agent name -> mermaid-safe id, filled as names are first seen
+        self.__agent_names = {}
 
     def to_markdown(self) -> str:
+        parts = []
         if self.kind == "sequenceDiagram":
-            return self.__to_sequenceDiagram()
+            self.__to_sequenceDiagram(parts)
         elif self.kind == "flowchart":
-            return self.__to_flowchart()
+            self.__to_flowchart(parts)
         else:
             raise RuntimeError(f"Invalid Mermaid kind: {self.kind}")
+        return "".join(parts)
 
     def __fix_agent_name(self, name):
-        return name.replace("-", "_")
+        fixed = self.__agent_names.get(name)
+        if fixed is None:
+            fixed = self.__agent_names[name] = name.replace("-", "_")
+        return fixed
 
     def __agent_for_step(self, step_name):
         for step in self.workflow['spec']['template']['steps']:
@@ -53,6 +60,22 @@ class Mermaid:
     # See mermaid sequence diagram documentation: 
     # https://mermaid.js.org/syntax/sequenceDiagram.html
 
+    # steps with any of these keys are scoring/context-only and not drawn
+    __CONTEXT_KEYS = ("inputs", "context", "outputs")
+
+    def __is_context_step(self, step):
+        return any(k in step for k in self.__CONTEXT_KEYS)
+
+    def __next_agents(self, steps):
+        # for each step, the agent of the next drawn step (None if it has none)
+        next_agents = [None] * len(steps)
+        following = None
+        for i in range(len(steps) - 1, -1, -1):
+            next_agents[i] = following
+            if not self.__is_context_step(steps[i]):
+                following = steps[i].get('agent')
+        return next_agents
+
     def __sequence_participants(self):
         tpl = self.workflow['spec']['template']
         agents = tpl.get('agents')
@@ -63,189 +86,160 @@ class Mermaid:
             a = step.get('agent')
             if not a:
                 continue
-            if any(k in step for k in ("inputs", "context", "outputs")):
+            if self.__is_context_step(step):
                 continue
             if a not in seen:
                 seen.append(a)
         return seen
 
-    def __to_sequenceDiagram(self) -> str:
-        sb = "sequenceDiagram\n"
+    def __to_sequenceDiagram(self, parts):
+        parts.append("sequenceDiagram\n")
         # participants
         for agent in self.__sequence_participants():
-            sb += f"participant {self.__fix_agent_name(agent)}\n"
+            parts.append(f"participant {self.__fix_agent_name(agent)}\n")
 
-        steps = self.workflow['spec']['template'].get('steps', [])
+        tpl = self.workflow['spec']['template']
+        steps = tpl.get('steps', [])
+        next_agents = self.__next_agents(steps)
         agentL = None
-        for i, step in enumerate(steps):
+        for step, next_agent in zip(steps, next_agents):
             # skip scoring/context-only steps
-            if any(k in step for k in ("inputs", "context", "outputs")):
+            if self.__is_context_step(step):
                 continue
             # update agentL only when this step names a real agent
             if step.get('agent'):
                 agentL = self.__fix_agent_name(step['agent'])
 
-            # find next real agent for the arrow
-            agentR = None
-            for nxt in steps[i+1:]:
-                if any(k in nxt for k in ("inputs", "context", "outputs")):
-                    continue
-                if nxt.get('agent'):
-                    agentR = self.__fix_agent_name(nxt['agent'])
-                break
+            # next real agent for the arrow
+            agentR = self.__fix_agent_name(next_agent) if next_agent else None
 
             if agentR:
-                sb += f"{agentL}->>{agentR}: {step['name']}\n"
+                parts.append(f"{agentL}->>{agentR}: {step['name']}\n")
             else:
-                sb += f"{agentL}->>{agentL}: {step['name']}\n"
+                parts.append(f"{agentL}->>{agentL}: {step['name']}\n")
 
             # condition / parallel / loop
             if step.get('condition'):
                 for cond in step['condition']:
-                    sb += self.__to_sequenceDiagram_condition(agentL, agentR, cond)
+                    self.__to_sequenceDiagram_condition(parts, agentL, agentR, cond)
             if step.get('parallel'):
-                sb += self.__to_sequenceDiagram_parallel(agentL, step)
+                self.__to_sequenceDiagram_parallel(parts, agentL, step)
             if step.get('loop'):
-                sb += self.__to_sequenceDiagram_loop(agentL, step['loop'])
+                self.__to_sequenceDiagram_loop(parts, agentL, step['loop'])
 
         # global cron-event block
-        event = self.workflow['spec']['template'].get('event')
+        event = tpl.get('event')
         if event and 'cron' in event:
-            sb += self.__to_sequenceDiagram_event(event)
+            self.__to_sequenceDiagram_event(parts, event)
 
         # global exception block
-        exc = self.workflow['spec']['template'].get('exception')
+        exc = tpl.get('exception')
         if exc:
-            sb += self.__to_sequenceDiagram_exception(
-                self.workflow['spec']['template'].get('steps', []), exc
-            )
-
-        return sb
+            self.__to_sequenceDiagram_exception(parts, steps, exc)
 
-    def __to_sequenceDiagram_event(self, event):
+    def __to_sequenceDiagram_event(self, parts, event):
         name  = event.get('name')
         cron  = event.get('cron')
         exit  = event.get('exit')
-        sb    = f"alt cron \"{cron}\"\n"
+        parts.append(f"alt cron \"{cron}\"\n")
         if event.get('steps'):
             for step_name in event['steps']:
-                sb += f"  cron->>{self.__agent_for_step(step_name)}: {step_name}\n"
+                parts.append(f"  cron->>{self.__agent_for_step(step_name)}: {step_name}\n")
         else:
             agent = event.get('agent')
-            sb += f"  cron->>{agent}: {name}\n"
-        sb += "else\n"
-        sb += f"  cron->>exit: {exit}\n"
-        sb += "end\n"
-        return sb
-
-    def __to_sequenceDiagram_parallel(self, agentL, parallelStep):
-        sb = "par\n"
+            parts.append(f"  cron->>{agent}: {name}\n")
+        parts.append("else\n")
+        parts.append(f"  cron->>exit: {exit}\n")
+        parts.append("end\n")
+
+    def __to_sequenceDiagram_parallel(self, parts, agentL, parallelStep):
+        parts.append("par\n")
         for i, agent in enumerate(parallelStep['parallel']):
             agentR = self.__fix_agent_name(agent)
-            sb += f"  {agentL}->>{agentR}: {parallelStep['name']}\n"
+            parts.append(f"  {agentL}->>{agentR}: {parallelStep['name']}\n")
             if i < len(parallelStep['parallel']) - 1:
-                sb += "and\n"
-        sb += "end\n"
-        return sb
+                parts.append("and\n")
+        parts.append("end\n")
 
-    def __to_sequenceDiagram_loop(self, agentL, loopDef):
+    def __to_sequenceDiagram_loop(self, parts, agentL, loopDef):
         expr = loopDef.get('until', 'True')
-        sb   = f"loop {expr}\n"
-        sb  += f"  {agentL}-->{self.__fix_agent_name(loopDef['agent'])}: {('until' if 'until' in loopDef else 'loop')}\n"
-        sb  += "end\n"
-        return sb
+        parts.append(f"loop {expr}\n")
+        parts.append(f"  {agentL}-->{self.__fix_agent_name(loopDef['agent'])}: {('until' if 'until' in loopDef else 'loop')}\n")
+        parts.append("end\n")
 
-    def __to_sequenceDiagram_condition(self, agentL, agentR, condition):
-        sb = ""
+    def __to_sequenceDiagram_condition(self, parts, agentL, agentR, condition):
         if condition.get('case'):
             cond = condition['case']
             do   = condition.get('do', '')
             if condition.get('default'):
                 cond = 'default'
                 do   = condition['default']
-            sb += f"{agentL}->>{agentR}: {do} {cond}\n"
+            parts.append(f"{agentL}->>{agentR}: {do} {cond}\n")
         elif condition.get('if'):
             if_expr   = condition['if']
             then_expr = condition.get('then', '')
             else_expr = condition.get('else')
-            sb       += f"{agentL}->>{agentR}: {if_expr}\n"
-            sb       += "alt if True\n"
-            sb       += f"  {agentL}->>{agentR}: {then_expr}\n"
+            parts.append(f"{agentL}->>{agentR}: {if_expr}\n")
+            parts.append("alt if True\n")
+            parts.append(f"  {agentL}->>{agentR}: {then_expr}\n")
             if else_expr:
-                sb   += "else is False\n"
-                sb   += f"  {agentR}->>{agentL}: {else_expr}\n"
-            sb       += "end\n"
-        return sb
+                parts.append("else is False\n")
+                parts.append(f"  {agentR}->>{agentL}: {else_expr}\n")
+            parts.append("end\n")
 
-    def __to_sequenceDiagram_exception(self, steps, exception):
-        sb = "alt exception\n"
+    def __to_sequenceDiagram_exception(self, parts, steps, exception):
+        parts.append("alt exception\n")
         for step in steps:
             if step.get('agent'):
                 agentL = self.__fix_agent_name(step['agent'])
-                sb    += f"  {agentL}->>{exception['agent']}: {exception['name']}\n"
-        sb += "end"
-        return sb
-
-    def __to_flowchart(self) -> str:
-        sb    = f"flowchart {self.orientation}\n"
-        steps = self.workflow['spec']['template'].get('steps', [])
-        i     = 0
-        while i < len(steps):
-            step = steps[i]
+                parts.append(f"  {agentL}->>{exception['agent']}: {exception['name']}\n")
+        parts.append("end")
+
+    def __to_flowchart(self, parts):
+        parts.append(f"flowchart {self.orientation}\n")
+        tpl   = self.workflow['spec']['template']
+        steps = tpl.get('steps', [])
+        for step, aR in zip(steps, self.__next_agents(steps)):
             # skip scoring/context-only steps
-            if any(k in step for k in ("inputs", "context", "outputs")):
-                i += 1
+            if self.__is_context_step(step):
                 continue
 
             aL = step.get('agent')
-            # find next real step
-            aR = None
-            for nxt in steps[i+1:]:
-                if any(k in nxt for k in ("inputs", "context", "outputs")):
-                    continue
-                aR = nxt.get('agent')
-                break
 
             if aR:
-                sb += f"{aL}-- {step['name']} -->{aR}\n"
+                parts.append(f"{aL}-- {step['name']} -->{aR}\n")
             else:
-                sb += f"{aL}-- {step['name']} -->{aL}\n"
+                parts.append(f"{aL}-- {step['name']} -->{aL}\n")
 
             if step.get('condition'):
                 for cond in step['condition']:
-                    sb += self.__to_flowchart_condition(aL, aR, step, cond)
-            i += 1
+                    self.__to_flowchart_condition(parts, aL, aR, step, cond)
 
-        exc = self.workflow['spec']['template'].get('exception')
+        exc = tpl.get('exception')
         if exc:
-            sb += self.__to_flowchart_exception(steps, exc)
-        return sb
+            self.__to_flowchart_exception(parts, steps, exc)
 
-    def __to_flowchart_condition(self, agentL, agentR, step, condition):
-        sb = ""
+    def __to_flowchart_condition(self, parts, agentL, agentR, step, condition):
         if condition.get('case'):
             cond = condition['case']
             do   = condition.get('do', '')
             if condition.get('default'):
                 cond = 'default'
                 do   = condition['default']
-            sb += f"{agentL}-- {do} {cond} -->{agentR}\n"
+            parts.append(f"{agentL}-- {do} {cond} -->{agentR}\n")
         if condition.get('if'):
             expr = condition['if']
             then = condition.get('then', '')
             els  = condition.get('else', '')
-            sb  += f"{step['name']} --> Condition{{\"{expr}\"}}\n"
-            sb  += f"  Condition -- Yes --> {then}\n"
-            sb  += f"  Condition -- No --> {els}\n"
-        return sb
+            parts.append(f"{step['name']} --> Condition{{\"{expr}\"}}\n")
+            parts.append(f"  Condition -- Yes --> {then}\n")
+            parts.append(f"  Condition -- No --> {els}\n")
 
-    def __to_flowchart_event(self, event):
-        return ""
+    def __to_flowchart_event(self, parts, event):
+        pass
 
-    def __to_flowchart_exception(self, steps, exception):
-        sb = ""
+    def __to_flowchart_exception(self, parts, steps, exception):
         for step in steps:
             if step.get('agent'):
                 agentL = self.__fix_agent_name(step['agent'])
-                sb    += f"{agentL} -->|exception| {exception['name']}{{{exception['agent']}}}\n"
-        return sb
+                parts.append(f"{agentL} -->|exception| {exception['name']}{{{exception['agent']}}}\n")
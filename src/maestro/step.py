@@ -1,13 +1,10 @@
 #! /usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 
-from dotenv import load_dotenv
 import asyncio
 import ast
 from maestro.utils import eval_expression, convert_to_list
 
-load_dotenv()
-
 class Step:
     """
     A class representing a step in a workflow.
@@ -15,9 +15,8 @@
 # limitations under the License.
 
 import os
-from dotenv import load_dotenv
-import time
-import pycron
+import asyncio
+import inspect
 
 from maestro.mermaid import Mermaid
 from maestro.step import Step
@@ -27,8 +26,6 @@ from maestro.agents.agent_factory import AgentFramework, AgentFactory
 from maestro.agents.agent import save_agent, restore_agent
 from maestro.agents.mock_agent import MockAgent
 
-load_dotenv()
-
 
 def get_agent_class(framework: str, mode="local") -> type:
     if os.getenv("DRY_RUN"):
@@ -51,6 +48,8 @@ def create_agents(agent_defs):
 class Workflow:
     def __init__(self, agent_defs=None, workflow=None):
         self.agents = {}
+        # set once every agent has been created or restored
+        self._agents_ready = False
         self.steps = {}
         self.agent_defs = agent_defs or []
         self.workflow = workflow or {}
@@ -64,7 +63,10 @@ class Workflow:
     async def run(self, prompt=''):
         if prompt:
             self.workflow['spec']['template']['prompt'] = prompt
-        self._create_or_restore_agents()
+        # agents are created or restored once and reused by later runs
+        if not self._agents_ready:
+            self._create_or_restore_agents()
+            self._agents_ready = True
 
         template = self.workflow['spec']['template']
         try:
@@ -82,6 +84,16 @@ class Workflow:
                     await handler.run(err)
                     return None
             raise err
+        finally:
+            await self._close_agents()
+
+    async def _close_agents(self):
+        # agents holding connections across runs (e.g. MCP servers) release them
+        # here, while the event loop they were opened on is still running
+        for agent in self.agents.values():
+            aclose = getattr(agent, "aclose", None)
+            if inspect.iscoroutinefunction(aclose):
+                await aclose()
 
     def _create_or_restore_agents(self):
         if self.agent_defs:
@@ -107,11 +119,19 @@ class Workflow:
                 return idx
         return None
 
+    def _index_steps(self, steps):
+        # step name -> position, first occurrence wins as in find_index
+        index = {}
+        for idx, step in enumerate(steps):
+            index.setdefault(step.get("name"), idx)
+        return index
+
     async def _condition(self):
         template = self.workflow["spec"]["template"]
         initial_prompt = template["prompt"]
         steps = template["steps"]
         step_defs = {step["name"]: step for step in steps}
+        step_index = self._index_steps(steps)
 
         for step in steps:
             if step.get("agent"):
@@ -134,24 +154,34 @@ class Workflow:
 
         while True:
             definition = step_defs[current]
-            if definition.get("inputs"):
-                args = []
-                for inp in definition["inputs"]:
-                    src = inp["from"]
-                    if src == "prompt":
-                        args.append(initial_prompt)
-                    elif "instructions:" in src:
-                        args.append(step_defs[src.split(":")[-1]]["agent"].agent_instr)
-                    elif src in step_results:
-                        args.append(step_results[src])
-                    else:
-                        args.append(src)
-                result = await self.steps[current].run(*args)
+            wave = self._independent_steps(steps, step_index[current]) if template.get("concurrent") else []
+            if len(wave) > 1:
+                # run together, then apply results in step order as if sequential;
+                # a failing step cancels the others before its error is raised
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        tasks = [
+                            group.create_task(self.steps[name].run(
+                                *self._step_args(step_defs[name], initial_prompt, step_defs, step_results)
+                            ))
+                            for name in wave
+                        ]
+                except ExceptionGroup as errors:
+                    raise errors.exceptions[0]
+                for name, task in zip(wave, tasks):
+                    result = task.result()
+                    prompt = result.get("prompt")
+                    step_results[name] = prompt
+                current = wave[-1]
             else:
-                result = await self.steps[current].run(prompt)
+                if definition.get("inputs"):
+                    args = self._step_args(definition, initial_prompt, step_defs, step_results)
+                    result = await self.steps[current].run(*args)
+                else:
+                    result = await self.steps[current].run(prompt)
 
-            prompt = result.get("prompt")
-            step_results[current] = prompt
+                prompt = result.get("prompt")
+                step_results[current] = prompt
 
             if "next" in result:
                 current = result["next"]
@@ -159,12 +189,48 @@ class Workflow:
                 last = steps[-1]["name"]
                 if current == last:
                     break
-                idx = self.find_index(steps, current)
-                current = steps[idx + 1]["name"]
+                current = steps[step_index[current] + 1]["name"]
 
         return {"final_prompt": prompt, **step_results}
 
+    def _step_args(self, definition, initial_prompt, step_defs, step_results):
+        args = []
+        for inp in definition["inputs"]:
+            src = inp["from"]
+            if src == "prompt":
+                args.append(initial_prompt)
+            elif "instructions:" in src:
+                args.append(step_defs[src.split(":")[-1]]["agent"].agent_instr)
+            elif src in step_results:
+                args.append(step_results[src])
+            else:
+                args.append(src)
+        return args
+
+    def _independent_steps(self, steps, start):
+        # Names of the consecutive steps from start that can run concurrently:
+        # agent steps reading only their declared inputs, none produced by
+        # another step of the group. Steps that may branch, fan out, loop or
+        # ask the user end the group, as does a step reusing an agent of the
+        # group, since an agent instance runs one prompt at a time.
+        wave = []
+        agents = []
+        for step in steps[start:]:
+            if not step.get("inputs") or not step.get("agent"):
+                break
+            if any(step.get(key) for key in ("condition", "parallel", "loop", "input")):
+                break
+            if any(inp["from"].split(":")[-1] in wave for inp in step["inputs"]):
+                break
+            if any(step["agent"] is agent for agent in agents):
+                break
+            wave.append(step["name"])
+            agents.append(step["agent"])
+        return wave
+
     async def process_event(self, result):
+        import pycron
+
         ev         = self.workflow['spec']['template']['event']
         cron       = ev.get('cron')
         agent_name = ev.get('agent')
@@ -195,12 +261,13 @@ class Workflow:
 
                 if exit_expr and eval_expression(exit_expr, result):
                     break
-            time.sleep(30)
+            await asyncio.sleep(30)
 
         return result
 
     async def _condition_subflow(self, steps, start, prompt):
         step_defs = {step["name"]: step for step in steps}
+        step_index = self._index_steps(steps)
         for step in steps:
             if step.get("loop"):
                 loop_def = step["loop"]
@@ -234,8 +301,7 @@ class Workflow:
             else:
                 if current == steps[-1]["name"]:
                     break
-                idx = self.find_index(steps, current)
-                current = steps[idx + 1]["name"]
+                current = steps[step_index[current] + 1]["name"]
 
         return {"final_prompt": prompt, **step_results}
 
@@ -14,9 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import dotenv, os, yaml
+import os, yaml
 import asyncio
-from dotenv import load_dotenv
 
 from unittest import TestCase
 
@@ -24,8 +23,6 @@ from maestro.cli.common import parse_yaml
 
 from maestro.workflow import Workflow
 
-load_dotenv()
-
 class CrewAITest(TestCase):
     def test_agent_runs(self) -> None:
         agents_yaml = parse_yaml(os.path.join(os.path.dirname(__file__), 'agents.yaml'))
@@ -41,7 +38,3 @@ class CrewAITest(TestCase):
 
         assert result is not None
         assert result["final_prompt"] == "OK"
-
-if __name__ == "__main__":
-    crewtest = CrewAITest()
-    crewtest.test_agent_runs()
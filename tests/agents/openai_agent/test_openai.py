@@ -16,6 +16,7 @@
 
 import os, dotenv, yaml
 import asyncio
+from collections import OrderedDict
 
 from unittest import TestCase
 import pytest
@@ -23,6 +24,7 @@ import pytest
 from maestro.cli.common import parse_yaml
 
 from maestro.workflow import Workflow
+from maestro.agents import openai_agent
 from maestro.agents.openai_agent import OpenAIAgent
 
 dotenv.load_dotenv()
@@ -50,3 +52,37 @@ def test_agent_runs(monkeypatch) -> None:
 
     assert result is not None
     assert result["final_prompt"].startswith("OK:Welcome") or result["final_prompt"].startswith("Mock agent")
+
+class RunResultMock:
+    def __init__(self, final_output):
+        self.final_output = final_output
+        self.messages = []
+
+@pytest.mark.parametrize("final_output", [None, ""])
+def test_fallback_output_not_cached(monkeypatch, final_output) -> None:
+    monkeypatch.setenv("MAESTRO_OPENAI_RESPONSE_CACHE_TTL", "60")
+    monkeypatch.delenv("MAESTRO_MCP_ENDPOINTS", raising=False)
+    results = [RunResultMock(final_output), RunResultMock("OK")]
+
+    async def run(agent, prompt):
+        return results.pop(0)
+
+    monkeypatch.setattr(openai_agent, "_RESPONSE_CACHE", OrderedDict())
+    monkeypatch.setattr(openai_agent.UnderlyingRunner, "run", run)
+    monkeypatch.setattr(OpenAIAgent, "_build_underlying_agent", lambda self, mcp_servers: None)
+    # the class cannot be called once test_agent_runs has patched and restored __new__
+    agent = object.__new__(OpenAIAgent)
+    agent.__init__({"metadata": {"name": "test-cache-agent"}, "spec": {"framework": "openai", "model": "cache-test-model"}})
+
+    async def run_thrice():
+        responses = [await agent._run_internal("Hi!") for _ in range(3)]
+        await agent.mcp_servers.aclose()
+        return responses
+
+    first, second, third = asyncio.run(run_thrice())
+    if final_output is None:
+        assert first.startswith("Agent run finished without explicit final output")
+    else:
+        assert first == final_output
+    assert second == third == "OK"
+    assert not results
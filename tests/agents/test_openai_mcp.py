@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import pickle
+import pytest
+
+from maestro.agents import openai_mcp
+from maestro.agents.openai_mcp import MCPServerManager
+
+class FakeServer:
+    """Async context MCP server; the endpoint text selects its behavior."""
+    instances = []
+
+    def __init__(self, name, params, cache_tools_list=False):
+        self.name = name
+        self.params = params
+        self.cache_tools_list = cache_tools_list
+        self.entered = False
+        self.exited = False
+        self.cancelled = False
+        self.tools_listed = 0
+        FakeServer.instances.append(self)
+
+    async def __aenter__(self):
+        target = self.params.get("url") or self.params["command"]
+        self.task = asyncio.current_task()
+        if target == "slow":
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        if target == "missing":
+            raise FileNotFoundError(target)
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc):
+        # the MCP transports must be exited from the task that entered them
+        assert asyncio.current_task() is self.task
+        self.exited = True
+
+    async def list_tools(self):
+        self.tools_listed += 1
+        return []
+
+@pytest.fixture(autouse=True)
+def fake_servers(monkeypatch):
+    FakeServer.instances = []
+    monkeypatch.setattr(openai_mcp, "MCPServerSse", FakeServer)
+    monkeypatch.setattr(openai_mcp, "MCPServerStdio", FakeServer)
+    monkeypatch.setenv("MAESTRO_MCP_CONNECT_TIMEOUT", "0.1")
+    yield
+    assert not openai_mcp._SHARED_SERVERS
+
+def make_manager(name="agent"):
+    printed = []
+    return MCPServerManager(print_func=printed.append, agent_name=name), printed
+
+def test_connects_servers_once(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool --flag, http://remote/sse")
+    manager, printed = make_manager()
+
+    async def run():
+        servers = await manager.get_servers()
+        assert [server.name for server in servers] == ["agent_MCP_Server_1_Stdio", "agent_MCP_Server_2_SSE"]
+        assert servers[0].params["args"] == ["--flag"]
+        assert all(server.entered and server.tools_listed == 1 for server in servers)
+        assert await manager.get_servers() == servers
+        await manager.aclose()
+        return servers
+
+    servers = asyncio.run(run())
+    assert all(server.exited for server in servers)
+    assert len(FakeServer.instances) == 2
+    assert printed[-1] == "INFO [agent - MCP Setup]: Successfully connected to 2 MCP server(s)."
+
+def test_connect_timeout(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "slow")
+    manager, printed = make_manager()
+
+    async def run():
+        servers = await manager.get_servers()
+        await manager.aclose()
+        return servers
+
+    assert asyncio.run(run()) == []
+    assert FakeServer.instances[0].cancelled
+    assert "connection timed out after 0.1s" in printed[0]
+
+def test_partial_failure_keeps_connected_servers(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool, missing, slow")
+    manager, printed = make_manager()
+
+    async def run():
+        servers = await manager.get_servers()
+        await manager.aclose()
+        return servers
+
+    servers = asyncio.run(run())
+    assert [server.params["command"] for server in servers] == ["tool"]
+    assert servers[0].exited
+    assert "command not found" in printed[1]
+    assert "connection timed out" in printed[2]
+    assert printed[-1] == "INFO [agent - MCP Setup]: Successfully connected to 1 MCP server(s)."
+
+def test_managers_share_servers(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool")
+    first, _ = make_manager("first")
+    second, _ = make_manager("second")
+
+    async def run():
+        servers, others = await asyncio.gather(first.get_servers(), second.get_servers())
+        assert servers[0] is others[0]
+        assert len(openai_mcp._SHARED_SERVERS) == 1
+        await first.aclose()
+        assert not servers[0].exited
+        await second.aclose()
+        assert servers[0].exited
+
+    asyncio.run(run())
+    assert len(FakeServer.instances) == 1
+
+def test_dead_owner_is_reconnected(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool, other")
+    manager, _ = make_manager()
+
+    async def run():
+        servers = await manager.get_servers()
+        shared = next(iter(openai_mcp._SHARED_SERVERS.values()))
+        shared.owners[0]._task.cancel()
+        await asyncio.sleep(0)
+        assert not shared.owners[0].alive
+
+        reconnected = await manager.get_servers()
+        assert reconnected[0] is not servers[0] and reconnected[0].entered
+        assert reconnected[1] is servers[1]
+        await manager.aclose()
+        assert all(server.exited for server in reconnected)
+
+    asyncio.run(run())
+
+def test_session_outlives_aclose(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool")
+    manager, _ = make_manager()
+
+    async def run():
+        async with manager.session() as servers:
+            await manager.aclose()
+            assert not servers[0].exited
+        assert servers[0].exited
+
+    asyncio.run(run())
+
+def test_failed_run_keeps_servers_of_other_runs(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool")
+    manager, _ = make_manager()
+
+    async def failing_run():
+        async with manager.session():
+            raise RuntimeError("run failed")
+
+    async def run():
+        async with manager.session() as servers:
+            with pytest.raises(RuntimeError):
+                await failing_run()
+            assert not servers[0].exited
+            assert await manager.get_servers() == servers
+        await manager.aclose()
+        assert servers[0].exited
+
+    asyncio.run(run())
+
+def test_pickled_manager_reconnects(monkeypatch):
+    monkeypatch.setenv("MAESTRO_MCP_ENDPOINTS", "tool")
+    manager = MCPServerManager(agent_name="agent")
+
+    async def run(manager):
+        servers = await manager.get_servers()
+        restored = pickle.loads(pickle.dumps(manager))
+        await manager.aclose()
+        return servers, restored
+
+    servers, restored = asyncio.run(run(manager))
+    assert restored.agent_name == "agent" and restored.print_func is print
+
+    async def run_restored():
+        reconnected = await restored.get_servers()
+        await restored.aclose()
+        return reconnected
+
+    reconnected = asyncio.run(run_restored())
+    assert reconnected[0] is not servers[0] and reconnected[0].exited
@@ -8,6 +8,16 @@ import litellm
 from maestro.agents.scoring_agent import ScoringAgent
 from opik.evaluation.metrics import AnswerRelevance, Hallucination
 
+AGENT_DEF = {
+    "metadata": {"name": "metrics_agent", "labels": {}},
+    "spec": {
+        "framework":    "custom",
+        "model":        "qwen3:latest",
+        "description":  "desc",
+        "instructions": "instr"
+    }
+}
+
 @pytest.fixture(autouse=True)
 def patch_litellm_provider(monkeypatch):
     monkeypatch.setattr(
@@ -35,16 +45,7 @@ def test_metrics_agent_run_with_context(monkeypatch):
     printed = []
     monkeypatch.setattr(ScoringAgent, "print", lambda self, msg: printed.append(msg))
 
-    agent_def = {
-        "metadata": {"name": "metrics_agent", "labels": {}},
-        "spec": {
-            "framework":    "custom",
-            "model":        "qwen3:latest",
-            "description":  "desc",
-            "instructions": "instr"
-        }
-    }
-    agent = ScoringAgent(agent_def)
+    agent = ScoringAgent(AGENT_DEF)
     prompt   = "What is the capital of France?"
     response = "Lyon"
     context  = ["Paris is the capital of France."]
@@ -57,3 +58,45 @@ def test_metrics_agent_run_with_context(monkeypatch):
 
     assert len(printed) == 1
     assert printed[0] == "Lyon\n[relevance: 0.50, hallucination: 0.20]"
+
+def test_metrics_agent_reuses_scores(monkeypatch):
+    calls = {"relevance": 0, "hallucination": 0}
+
+    def fake_rel(self, input, output, context):
+        calls["relevance"] += 1
+        return 0.75
+
+    def fake_hall(self, input, output, context):
+        calls["hallucination"] += 1
+        return 0.10
+
+    monkeypatch.setattr(AnswerRelevance,  "score", fake_rel)
+    monkeypatch.setattr(Hallucination,     "score", fake_hall)
+
+    printed = []
+    monkeypatch.setattr(ScoringAgent, "print", lambda self, msg: printed.append(msg))
+
+    agent = ScoringAgent(AGENT_DEF)
+    for _ in range(2):
+        asyncio.run(agent.run("What is the capital of France?", "Paris"))
+    asyncio.run(agent.run("What is the capital of France?", "Lyon"))
+
+    assert calls == {"relevance": 2, "hallucination": 2}
+    assert printed[0] == printed[1] == "Paris\n[relevance: 0.75, hallucination: 0.10]"
+
+def test_metrics_agent_scores_restored_agent_with_dict_context(monkeypatch):
+    monkeypatch.setattr(AnswerRelevance,  "score", lambda self, input, output, context: 0.75)
+    monkeypatch.setattr(Hallucination,     "score", lambda self, input, output, context: 0.10)
+
+    printed = []
+    monkeypatch.setattr(ScoringAgent, "print", lambda self, msg: printed.append(msg))
+
+    agent = ScoringAgent(AGENT_DEF)
+    # as restored from a pickle saved before the score cache existed
+    del agent._scores
+    context = [{"source": "atlas", "text": "Paris is the capital of France."}]
+    for _ in range(2):
+        asyncio.run(agent.run("What is the capital of France?", "Paris", context=context))
+
+    assert printed == ["Paris\n[relevance: 0.75, hallucination: 0.10]"] * 2
+    assert len(agent._scores) == 1
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+
+from maestro.agents import slack_agent
+from maestro.agents.slack_agent import SlackAgent
+
+def test_slack_agent_returns_posted_message(monkeypatch):
+    """
+    SlackAgent.run() posts the prompt from a worker thread and returns it,
+    so the message is the step output for later steps.
+    """
+    posted = []
+
+    def fake_post(channel_id, message):
+        posted.append((channel_id, message, threading.current_thread() is threading.main_thread()))
+
+    monkeypatch.setattr(slack_agent, "post_message_to_slack", fake_post)
+    monkeypatch.setenv("SLACK_TEAM_ID", "C123")
+    agent_def = {
+        "metadata": {"name": "test-slack-agent", "labels": {}},
+        "spec": {
+            "framework": "custom",
+            "model": "dummy",
+            "description": "desc",
+            "instructions": "instr"
+        }
+    }
+    agent = SlackAgent(agent_def)
+    result = asyncio.run(agent.run("Hi!"))
+    assert result == "Hi!"
+    assert posted == [("C123", "Hi!", False)]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# Copyright © 2025 IBM
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import TestCase
+
+from maestro.cli import common
+from maestro.cli.common import parse_yaml
+
+# `parse_yaml` tests
+class ParseYamlTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.yaml_file = os.path.join(self.tmp_dir, "workflow.yaml")
+        shutil.copy(os.path.join(os.path.dirname(__file__), "../yamls/workflows/simple_workflow.yaml"), self.yaml_file)
+        common._load_yaml.cache_clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_parse_yaml_parses_once(self):
+        first = parse_yaml(self.yaml_file, shared=True)
+        second = parse_yaml(self.yaml_file, shared=True)
+        self.assertIs(first, second)
+        self.assertEqual(common._load_yaml.cache_info().misses, 1)
+
+    def test_parse_yaml_copies_do_not_share_state(self):
+        first = parse_yaml(self.yaml_file)
+        first[0]["spec"]["template"]["steps"].clear()
+        second = parse_yaml(self.yaml_file)
+        self.assertTrue(second[0]["spec"]["template"]["steps"])
+        self.assertEqual(second, parse_yaml(self.yaml_file, shared=True))
+        self.assertEqual(common._load_yaml.cache_info().misses, 1)
+
+    def test_parse_yaml_reparses_edited_file(self):
+        parse_yaml(self.yaml_file, shared=True)
+        with open(self.yaml_file, "a") as file:
+            file.write("---\nkind: Workflow\n")
+        self.assertEqual(parse_yaml(self.yaml_file, shared=True)[-1], {"kind": "Workflow"})
+        self.assertEqual(common._load_yaml.cache_info().misses, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Copyright © 2025 IBM
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+import maestro.workflow
+from maestro.workflow import Workflow
+
+class StubAgent:
+    created = []
+    fail_once = set()
+
+    def __init__(self, agent_def):
+        self.agent_name = agent_def["metadata"]["name"]
+        if self.agent_name in StubAgent.fail_once:
+            StubAgent.fail_once.discard(self.agent_name)
+            raise RuntimeError(f"cannot create {self.agent_name}")
+        StubAgent.created.append(self.agent_name)
+
+    async def run(self, prompt):
+        return f"{self.agent_name}: {prompt}"
+
+@pytest.fixture(autouse=True)
+def stub_agents(monkeypatch):
+    StubAgent.created = []
+    StubAgent.fail_once = set()
+    monkeypatch.setattr(maestro.workflow, "get_agent_class", lambda framework, mode=None: StubAgent)
+
+def make_workflow():
+    agent_defs = [{"metadata": {"name": name}, "spec": {"framework": "mock"}} for name in ("first", "second")]
+    workflow = {
+        "spec": {
+            "template": {
+                "prompt": "hello",
+                "steps": [
+                    {"name": "step1", "agent": "first"},
+                    {"name": "step2", "agent": "second"},
+                ],
+            }
+        }
+    }
+    return Workflow(agent_defs, workflow)
+
+def test_agents_created_once():
+    workflow = make_workflow()
+    asyncio.run(workflow.run())
+    result = asyncio.run(workflow.run())
+
+    assert StubAgent.created == ["first", "second"]
+    assert result["final_prompt"] == "second: first: hello"
+
+def test_agents_created_again_after_partial_failure():
+    StubAgent.fail_once = {"second"}
+    workflow = make_workflow()
+    with pytest.raises(RuntimeError, match="cannot create second"):
+        asyncio.run(workflow.run())
+
+    result = asyncio.run(workflow.run())
+
+    assert StubAgent.created == ["first", "first", "second"]
+    assert result["final_prompt"] == "second: first: hello"
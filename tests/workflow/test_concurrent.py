@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# Copyright © 2025 IBM
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import pytest
+
+import maestro.workflow
+from maestro.workflow import Workflow
+
+# `concurrent` tests: step2 and step3 only read their declared inputs
+STEPS = [
+    {"name": "step1", "agent": "first"},
+    {"name": "step2", "agent": "second", "inputs": [{"from": "prompt"}]},
+    {"name": "step3", "agent": "third", "inputs": [{"from": "step1"}]},
+]
+
+class StubAgent:
+    """Records its calls; the behavior of each agent is set per test in `actions`."""
+    calls = {}
+    log = []
+    actions = {}
+
+    def __init__(self, agent_def):
+        self.agent_name = agent_def["metadata"]["name"]
+
+    async def run(self, *args):
+        StubAgent.calls.setdefault(self.agent_name, []).append(args)
+        StubAgent.log.append(f"{self.agent_name} start")
+        action = StubAgent.actions.get(self.agent_name)
+        if action:
+            await action()
+        StubAgent.log.append(f"{self.agent_name} end")
+        return f"{self.agent_name} output"
+
+@pytest.fixture(autouse=True)
+def stub_agents(monkeypatch):
+    StubAgent.calls = {}
+    StubAgent.log = []
+    StubAgent.actions = {}
+    monkeypatch.setattr(maestro.workflow, "get_agent_class", lambda framework, mode=None: StubAgent)
+
+def make_workflow(steps, concurrent=True):
+    agent_names = sorted({step["agent"] for step in steps})
+    agent_defs = [{"metadata": {"name": name}, "spec": {"framework": "mock"}} for name in agent_names]
+    workflow = {
+        "spec": {
+            "template": {
+                "prompt": "the prompt",
+                "concurrent": concurrent,
+                "steps": [dict(step) for step in steps],
+            }
+        }
+    }
+    return Workflow(agent_defs, workflow)
+
+def test_independent_steps_overlap():
+    started = []
+    both_started = asyncio.Event()
+
+    async def barrier():
+        # each step waits for the other, so a sequential run times out
+        started.append(1)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), 1)
+
+    StubAgent.actions = {"second": barrier, "third": barrier}
+    result = asyncio.run(make_workflow(STEPS).run())
+
+    assert StubAgent.calls["second"] == [("the prompt",)]
+    assert StubAgent.calls["third"] == [("first output",)]
+    assert result["step2"] == "second output"
+    assert result["final_prompt"] == result["step3"] == "third output"
+
+def test_failing_step_cancels_the_others():
+    cancelled = []
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("step2 failed")
+
+    async def wait_forever():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append("third")
+            raise
+
+    StubAgent.actions = {"second": fail, "third": wait_forever}
+    with pytest.raises(ValueError, match="step2 failed"):
+        asyncio.run(make_workflow(STEPS).run())
+
+    assert cancelled == ["third"]
+
+def test_steps_run_in_order_by_default():
+    StubAgent.actions = {"second": lambda: asyncio.sleep(0), "third": lambda: asyncio.sleep(0)}
+    asyncio.run(make_workflow(STEPS, concurrent=False).run())
+
+    assert StubAgent.log == [
+        "first start", "first end",
+        "second start", "second end",
+        "third start", "third end",
+    ]
+
+def test_steps_sharing_an_agent_run_in_order():
+    steps = [dict(step) for step in STEPS]
+    steps[2]["agent"] = "second"
+    StubAgent.actions = {"second": lambda: asyncio.sleep(0)}
+    result = asyncio.run(make_workflow(steps).run())
+
+    assert StubAgent.log == [
+        "first start", "first end",
+        "second start", "second end",
+        "second start", "second end",
+    ]
+    assert StubAgent.calls["second"] == [("the prompt",), ("first output",)]
+    assert result["final_prompt"] == "second output"